@@ -1,7 +1,16 @@
 """
-Module to reverse a 32-bit signed integer safely.
+Module to check whether a number is an Armstrong (narcissistic) number.
+
+armstrong_number_many checks a whole NumPy int64 array at once, raising
+each digit to the digit count of its own value with integer-only arithmetic.
+
+narcissistic_numbers enumerates every Armstrong number with up to 39 digits
+(there are none longer) by walking digit multisets instead of integers.
 """
-import math
+import multiprocessing
+import time
+
+MAX_NARCISSISTIC_DIGITS = 39
 
 
 def armstrong_number(n: int) -> bool:
@@ -11,21 +20,192 @@ def armstrong_number(n: int) -> bool:
     An Armstrong number (or narcissistic number) for a given number of digits n is an integer 
     such that the sum of its own digits each raised to the power n is equal to the number itself.
 
+    Only non-negative numbers can be Armstrong numbers.
+
     :param n: The number to check.
     :return: True if n is an Armstrong number, False otherwise.
     """
 
+    if n < 0:
+        return False
+
     arms_sum = 0
     given_number = n
+    digit_count = len(str(abs(n)))
 
     while n:
-        last_digit = int(math.fmod(n, 10))
-        arms_sum += last_digit ** 3
-        n = int(n / 10)
+        n, last_digit = divmod(n, 10)
+        arms_sum += last_digit ** digit_count
 
     return given_number == arms_sum
 
 
+def armstrong_number_many(values):
+    """
+    Check every value in an int64 array for being an Armstrong number.
+
+    Digits are peeled off one column at a time with integer divmod, and
+    d^k is looked up in a 20 x 10 table indexed by (digit count, digit).
+    The running sums are kept in uint64 and capped at 2^63, which is above
+    any int64 value, so they cannot overflow.
+
+    Time complexity: O(k * w) for k values of at most w digits.
+
+    :param values: Array-like of integers that fit in int64.
+    :return: NumPy bool array, True where the value is an Armstrong number.
+    """
+    import numpy as np
+
+    numbers = np.asarray(values, dtype=np.int64)
+    remaining = np.where(numbers > 0, numbers, 0).astype(np.uint64)
+
+    powers_of_ten = 10 ** np.arange(19, dtype=np.uint64)
+    counts = np.maximum(np.searchsorted(powers_of_ten, remaining, side="right"), 1)
+
+    power_table = np.array(
+        [[d ** k for d in range(10)] for k in range(20)], dtype=np.uint64
+    )
+    cap = np.uint64(1 << 63)
+    ten = np.uint64(10)
+
+    arms_sum = np.zeros(numbers.shape, dtype=np.uint64)
+    while remaining.any():
+        remaining, digit = np.divmod(remaining, ten)
+        arms_sum = np.minimum(arms_sum + power_table[counts, digit], cap)
+
+    return (numbers >= 0) & (arms_sum == numbers.astype(np.uint64))
+
+
+def benchmark_armstrong_number(size: int = 200_000) -> None:
+    """
+    Compare armstrong_number in a Python loop against armstrong_number_many.
+
+    :param size: Number of random values to check.
+    """
+    import numpy as np
+
+    # The whole int64 range, plus Armstrong numbers of 3 to 19 digits and a
+    # negative one, so the comparison covers values above 2^53.
+    info = np.iinfo(np.int64)
+    values = np.random.default_rng(0).integers(info.min, info.max, size, dtype=np.int64,
+                                               endpoint=True)
+    values[:10] = [153, 9926315, 4679307774, 35641594208964132, 35875699062250035,
+                   1517841543307505039, 3289582984443187032, 4498128791164624869,
+                   4929273885928088826, -153]
+    scalar_values = values.tolist()
+
+    start = time.perf_counter()
+    looped = [armstrong_number(n) for n in scalar_values]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = armstrong_number_many(values)
+    batch_time = time.perf_counter() - start
+
+    assert looped == batched.tolist()
+    print(f"armstrong_number loop:  {size / loop_time:,.0f} values/s")
+    print(f"armstrong_number_many:  {size / batch_time:,.0f} values/s")
+
+
+def _search_digit_counts(length, powers, counts, digit, remaining, partial):
+    """
+    Assign how often each digit from `digit` down to 0 occurs and yield
+    every completed multiset whose power sum is narcissistic.
+
+    :param length: Number of digits k of the candidates.
+    :param powers: Table with powers[d] == d ** k.
+    :param counts: counts[d] for digits above `digit`, filled in place.
+    :param digit: Digit whose count is chosen next.
+    :param remaining: Digits still to be placed.
+    :param partial: Power sum of the digits placed so far.
+    :return: Generator of narcissistic numbers.
+    """
+    lower = 10 ** (length - 1) if length > 1 else 0
+    upper = 10 ** length - 1
+
+    if digit == 0:
+        counts[0] = remaining
+        if lower <= partial <= upper:
+            digits = str(partial)
+            if all(digits.count(str(d)) == counts[d] for d in range(10)):
+                yield partial
+        return
+
+    # The leading digits shared by the smallest and largest reachable sums
+    # are already known; they must fit in the multiset chosen so far.
+    low = max(partial, lower)
+    high = min(partial + remaining * powers[digit], upper)
+    if low > high:
+        return
+    low_text, high_text = str(low), str(high)
+    shared = 0
+    while shared < length and low_text[shared] == high_text[shared]:
+        shared += 1
+    prefix = low_text[:shared]
+    if any(prefix.count(str(d)) > counts[d] for d in range(digit + 1, 10)):
+        return
+    if sum(prefix.count(str(d)) for d in range(digit + 1)) > remaining:
+        return
+
+    for count in range(remaining + 1):
+        total = partial + count * powers[digit]
+        if total > upper:
+            break
+        counts[digit] = count
+        yield from _search_digit_counts(
+            length, powers, counts, digit - 1, remaining - count, total
+        )
+    counts[digit] = 0
+
+
+def narcissistic_numbers_of_length(length: int):
+    """
+    Yield every Armstrong number with exactly `length` digits, as found.
+
+    Only digit multisets are visited (combinations with replacement), and a
+    branch is dropped as soon as its reachable power sums cannot have
+    `length` digits or cannot contain the digits chosen so far.
+
+    :param length: Number of digits, 1 <= length <= 39.
+    :return: Generator of Armstrong numbers (not necessarily sorted).
+    """
+    powers = [d ** length for d in range(10)]
+    yield from _search_digit_counts(length, powers, [0] * 10, 9, length, 0)
+
+
+def _narcissistic_list_of_length(length: int) -> list[int]:
+    """
+    Pool worker: return the sorted Armstrong numbers with `length` digits.
+    """
+    return sorted(narcissistic_numbers_of_length(length))
+
+
+def narcissistic_numbers(max_digits: int = MAX_NARCISSISTIC_DIGITS, processes: int = 0):
+    """
+    Yield every Armstrong number with at most max_digits digits.
+
+    Without a pool the numbers stream out as soon as they are found, in
+    ascending length. With processes > 0, each digit length runs in its own
+    worker task (longest first, since they dominate the run time) and each
+    length's numbers are yielded as soon as that task finishes.
+
+    :param max_digits: Largest digit length to search, at most 39.
+    :param processes: Number of worker processes; 0 searches in-process.
+    :return: Generator of Armstrong numbers.
+    """
+    lengths = range(1, min(max_digits, MAX_NARCISSISTIC_DIGITS) + 1)
+
+    if processes <= 0:
+        for length in lengths:
+            yield from narcissistic_numbers_of_length(length)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        tasks = pool.imap_unordered(_narcissistic_list_of_length, reversed(lengths))
+        for numbers in tasks:
+            yield from numbers
+
+
 if __name__ == "__main__":
     print("Is Armstrong number:", armstrong_number(153))  # True
     print("Is Armstrong number:", armstrong_number(370))  # True
@@ -33,3 +213,15 @@ if __name__ == "__main__":
     print("Is Armstrong number:", armstrong_number(9474))  # True
     print("Is Armstrong number:", armstrong_number(123))  # False
     print("Is Armstrong number:", armstrong_number(1000))  # False
+
+    print("Is Armstrong number:", armstrong_number_many([153, 9474, 123, 0, -153]))
+    # Output: [ True  True False  True False]
+    benchmark_armstrong_number()
+
+    print("Armstrong numbers up to 7 digits:", sorted(narcissistic_numbers(7)))
+    # Output: [0, 1, ..., 9, 153, 370, 371, 407, 1634, 8208, 9474, 54748, 92727, 93084,
+    #          548834, 1741725, 4210818, 9800817, 9926315]
+    print("Armstrong numbers with 8-10 digits:",
+          sorted(n for n in narcissistic_numbers(10, processes=2) if n >= 10**7))
+    # Output: [24678050, 24678051, 88593477, 146511208, 472335975, 534494836,
+    #          912985153, 4679307774]
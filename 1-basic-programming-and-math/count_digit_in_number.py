@@ -3,10 +3,20 @@ This module provides two functions to count the number of digits in an integer:
 - count_digit: iterative approach with O(log n) time complexity.
 - count_digit_con: constant time approach using logarithm.
 Both handle zero and negative inputs gracefully.
+
+count_digit_many counts the digits of a whole NumPy int64 array at once
+with integer-only comparisons against powers of ten.
+
+count_digit_big gives the exact count for arbitrarily large integers,
+where math.log10 loses precision and repeated division is quadratic.
 """
 
 
+import functools
 import math
+import time
+
+LOG10_2 = math.log10(2)
 
 
 def count_digit(n):
@@ -38,6 +48,89 @@ def count_digit_opt(n: int) -> int:
     return int(math.log10(n)) + 1
 
 
+def count_digit_many(values):
+    """
+    Count digits of every value in an int64 array.
+
+    Each |n| is located among the powers of ten 10^0 .. 10^18 with a binary
+    search, so no float division or logarithm is involved. Zero has 1 digit
+    and the sign is ignored.
+
+    Time complexity: O(k) for k values (19 powers of ten per search).
+
+    :param values: Array-like of integers that fit in int64 (excluding -2^63).
+    :return: NumPy int64 array of digit counts.
+    """
+    import numpy as np
+
+    magnitudes = np.abs(np.asarray(values, dtype=np.int64))
+    powers_of_ten = 10 ** np.arange(19, dtype=np.int64)
+    counts = np.searchsorted(powers_of_ten, magnitudes, side="right")
+    return np.maximum(counts, 1).astype(np.int64)
+
+
+def benchmark_count_digit(size: int = 200_000) -> None:
+    """
+    Compare count_digit in a Python loop against count_digit_many.
+
+    :param size: Number of random values to count digits of.
+    """
+    import numpy as np
+
+    values = np.random.default_rng(0).integers(1, 10**15, size, dtype=np.int64)
+    scalar_values = values.tolist()
+
+    start = time.perf_counter()
+    looped = [count_digit(n) for n in scalar_values]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = count_digit_many(values)
+    batch_time = time.perf_counter() - start
+
+    assert looped == batched.tolist()
+    print(f"count_digit loop:  {size / loop_time:,.0f} values/s")
+    print(f"count_digit_many:  {size / batch_time:,.0f} values/s")
+
+
+@functools.lru_cache(maxsize=64)
+def _power_of_ten(k: int) -> int:
+    """
+    Return 10^k, cached so repeated counts of similar sizes reuse it.
+    """
+    return 10 ** k
+
+
+def count_digit_big(n: int) -> int:
+    """
+    Count digits in an arbitrarily large integer exactly.
+
+    The count is estimated from n.bit_length() and then corrected by
+    comparing against cached powers of ten, so it never divides n and never
+    converts it to a float. Zero has 1 digit and the sign is ignored.
+
+    Time complexity: O(M(d)), the cost of building one d-digit power of ten.
+
+    :param n: Any integer.
+    :return: Number of decimal digits in |n|.
+    """
+    n = abs(n)
+    if n < 10:
+        return 1
+
+    exponent = int((n.bit_length() - 1) * LOG10_2)
+    while n >= _power_of_ten(exponent + 1):
+        exponent += 1
+    while n < _power_of_ten(exponent):
+        exponent -= 1
+
+    return exponent + 1
+
+
 if __name__ == "__main__":
     print("Count of digits:", count_digit(65984))
     print("Count of digits:", count_digit_opt(65984465))
+    print("Count of digits:", count_digit_big(-(10**1_000_000)))  # Output: 1000001
+    print("Count of digits:", count_digit_many([0, 7, -65984, 10**18]))
+    # Output: [ 1  1  5 19]
+    benchmark_count_digit()
@@ -2,7 +2,23 @@
 This module provides functions to calculate the Greatest Common Divisor (GCD) of two integers.
 It includes a basic implementation that checks all possible divisors up to the minimum of the 
 two numbers.
+
+For many values at once it also provides gcd_many (element-wise GCD of two arrays),
+gcd_reduce (GCD of a whole stream) and batch_gcd, Bernstein's product-tree /
+remainder-tree method for finding moduli that share a factor with any other modulus.
+
+For very large operands, lehmer_gcd and extended_gcd run most Euclidean steps on the
+leading machine word only, and mod_inverse builds on extended_gcd.
 """
+import itertools
+import math
+import random
+import time
+
+LEHMER_WORD_BITS = 64
+# Below this many bits (about 1,800 digits) the bookkeeping of a Lehmer round
+# costs more than the full-size modulo steps it saves, so plain Euclid finishes.
+LEHMER_CUTOFF_BITS = 6000
 
 
 def gcd_func(a: int, b: int) -> int:
@@ -61,6 +77,250 @@ def euclidian_gcd(a: int, b: int) -> int:
     return a
 
 
+def gcd_many(a_values, b_values):
+    """
+    Calculate the element-wise GCD of two equally long sequences.
+
+    int64-compatible inputs go through NumPy's vectorized np.gcd. Values that
+    do not fit in int64 (big Python ints) fall back to math.gcd per pair.
+
+    Time complexity: O(k log(max)) for k pairs.
+
+    :param a_values: First sequence of integers.
+    :param b_values: Second sequence of integers.
+    :return: NumPy int64 array of GCDs, or a list of ints for big inputs.
+    """
+    import numpy as np
+
+    try:
+        a_array = np.asarray(a_values, dtype=np.int64)
+        b_array = np.asarray(b_values, dtype=np.int64)
+    except OverflowError:
+        return list(map(math.gcd, a_values, b_values))
+
+    return np.gcd(a_array, b_array)
+
+
+def gcd_reduce(values, chunk_size: int = 4096) -> int:
+    """
+    Calculate the GCD of every value in an iterable, reading it in chunks.
+    Stops early once the GCD drops to 1, since it can never grow again.
+
+    Time complexity: O(k log(max)) for k values.
+
+    :param values: Iterable of integers (may be a generator).
+    :param chunk_size: Number of values folded per math.gcd call.
+    :return: GCD of all values, 0 for an empty iterable.
+    """
+    iterator = iter(values)
+    gcd = 0
+
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        gcd = math.gcd(gcd, *chunk)
+        if gcd == 1:
+            break
+
+    return gcd
+
+
+def product_tree(values: list[int]) -> list[list[int]]:
+    """
+    Build a product tree: level 0 holds the values, every next level holds the
+    products of adjacent pairs, and the last level holds the single total product.
+
+    :param values: Non-empty list of integers.
+    :return: List of levels, leaves first.
+    """
+    tree = [list(values)]
+
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([
+            level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ])
+
+    return tree
+
+
+def batch_gcd(moduli: list[int]) -> list[int]:
+    """
+    For every modulus N_i, calculate gcd(N_i, product of all other moduli).
+
+    Bernstein's batch GCD: the total product P is pushed down a remainder
+    tree, reducing modulo the square of every node, so each leaf ends up with
+    P mod N_i^2. Then gcd((P mod N_i^2) / N_i, N_i) is the shared factor.
+    A result other than 1 means N_i shares a prime with some other modulus.
+
+    Time complexity: O(M(n) log n) for moduli of n total bits, instead of the
+    O(k^2) euclidian_gcd calls needed to compare every pair.
+
+    :param moduli: List of positive integers.
+    :return: List of shared factors, aligned with moduli.
+    """
+    if not moduli:
+        return []
+
+    tree = product_tree(moduli)
+    remainders = tree[-1]
+
+    for level in reversed(tree[:-1]):
+        remainders = [
+            remainders[i // 2] % (value * value)
+            for i, value in enumerate(level)
+        ]
+
+    return [
+        math.gcd(remainder // modulus, modulus)
+        for remainder, modulus in zip(remainders, moduli)
+    ]
+
+
+def _lehmer_step(a: int, b: int) -> tuple[int, int, int, int]:
+    """
+    Simulate Euclidean steps on the leading LEHMER_WORD_BITS bits of a and b.
+
+    Knuth's Algorithm L: the quotients are computed from the leading words
+    and kept only while both bounds (x + A) / (y + C) and (x + B) / (y + D)
+    agree, which guarantees they equal the quotients of the full numbers.
+
+    :param a: Larger operand, a >= b.
+    :param b: Smaller operand.
+    :return: Cofactors (A, B, C, D) with new a = A*a + B*b, new b = C*a + D*b.
+    """
+    shift = max(a.bit_length() - LEHMER_WORD_BITS, 0)
+    x, y = a >> shift, b >> shift
+    coef_a, coef_b, coef_c, coef_d = 1, 0, 0, 1
+
+    while y + coef_c != 0 and y + coef_d != 0:
+        quotient = (x + coef_a) // (y + coef_c)
+        if quotient != (x + coef_b) // (y + coef_d):
+            break
+        coef_a, coef_c = coef_c, coef_a - quotient * coef_c
+        coef_b, coef_d = coef_d, coef_b - quotient * coef_d
+        x, y = y, x - quotient * y
+
+    return coef_a, coef_b, coef_c, coef_d
+
+
+def lehmer_gcd(a: int, b: int) -> int:
+    """
+    Calculate the GCD of two (very large) integers with Lehmer's algorithm.
+
+    Each round replaces up to ~LEHMER_WORD_BITS / 2 full-size modulo steps of
+    euclidian_gcd with word-sized arithmetic plus one 2x2 cofactor update.
+    Once the smaller operand drops below LEHMER_CUTOFF_BITS, plain Euclidean
+    steps are faster and finish the job.
+
+    Time complexity: O(n^2 / w) word operations for n-bit operands and word size w.
+
+    :param a: First integer.
+    :param b: Second integer.
+    :return: GCD of a and b.
+    """
+    a, b = abs(a), abs(b)
+    if a < b:
+        a, b = b, a
+
+    while b >> LEHMER_CUTOFF_BITS:
+        coef_a, coef_b, coef_c, coef_d = _lehmer_step(a, b)
+        if coef_b == 0:
+            a, b = b, a % b
+        else:
+            a, b = coef_a * a + coef_b * b, coef_c * a + coef_d * b
+
+    while b:
+        a, b = b, a % b
+
+    return a
+
+
+def extended_gcd(a: int, b: int) -> tuple[int, int, int]:
+    """
+    Calculate the GCD of a and b together with Bezout coefficients x, y
+    such that a*x + b*y == gcd. Uses the same Lehmer rounds as lehmer_gcd
+    and tracks only the coefficient of a; y is recovered at the end.
+
+    Time complexity: O(n^2 / w) word operations for n-bit operands.
+
+    :param a: First integer.
+    :param b: Second integer.
+    :return: Tuple (gcd, x, y).
+    """
+    big, small = abs(a), abs(b)
+    swapped = big < small
+    if swapped:
+        big, small = small, big
+
+    # Invariant: big == s_big * |first| (mod |second|), same for small.
+    s_big, s_small = 1, 0
+    while small >> LEHMER_CUTOFF_BITS:
+        coef_a, coef_b, coef_c, coef_d = _lehmer_step(big, small)
+        if coef_b == 0:
+            quotient, remainder = divmod(big, small)
+            big, small = small, remainder
+            s_big, s_small = s_small, s_big - quotient * s_small
+        else:
+            big, small = coef_a * big + coef_b * small, coef_c * big + coef_d * small
+            s_big, s_small = coef_a * s_big + coef_b * s_small, coef_c * s_big + coef_d * s_small
+
+    while small:
+        quotient, remainder = divmod(big, small)
+        big, small = small, remainder
+        s_big, s_small = s_small, s_big - quotient * s_small
+
+    first, second = (abs(b), abs(a)) if swapped else (abs(a), abs(b))
+    x = s_big
+    y = (big - x * first) // second if second else 0
+    if swapped:
+        x, y = y, x
+
+    if a < 0:
+        x = -x
+    if b < 0:
+        y = -y
+    return big, x, y
+
+
+def mod_inverse(a: int, m: int) -> int:
+    """
+    Calculate the inverse of a modulo m, i.e. x with (a * x) % m == 1.
+
+    :param a: Integer to invert.
+    :param m: Modulus, m > 1.
+    :return: The inverse in [0, m).
+    :raises ValueError: If a and m are not coprime.
+    """
+    gcd, x, _ = extended_gcd(a % m, m)
+    if gcd != 1:
+        raise ValueError(f"{a} has no inverse modulo {m} (gcd is {gcd})")
+    return x % m
+
+
+def benchmark_gcd(digit_sizes=(1_000, 10_000, 100_000)) -> None:
+    """
+    Compare euclidian_gcd against lehmer_gcd on random operands.
+
+    :param digit_sizes: Operand sizes in decimal digits.
+    """
+    rng = random.Random(0)
+    for digits in digit_sizes:
+        bits = int(digits / math.log10(2))
+        a, b = rng.getrandbits(bits), rng.getrandbits(bits)
+
+        start = time.perf_counter()
+        expected = euclidian_gcd(a, b)
+        euclid_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = lehmer_gcd(a, b)
+        lehmer_time = time.perf_counter() - start
+
+        assert result == expected
+        print(f"{digits:>7} digits: euclidian_gcd {euclid_time:.3f}s, "
+              f"lehmer_gcd {lehmer_time:.3f}s ({euclid_time / lehmer_time:.1f}x)")
+
+
 if __name__ == "__main__":
     print("GCD of 12 and 9:", gcd_func(12, 9))  # Output: 3
     print("GCD of 56 and 98:", gcd_func(56, 98))  # Output: 14
@@ -70,3 +330,13 @@ if __name__ == "__main__":
 
     print("GCD of 11 and 13:", euclidian_gcd(11, 13))  # Output: 1
     print("GCD of 52 and 2:", euclidian_gcd(52, 2))  # Output: 2
+
+    print("GCDs:", gcd_many([12, 56, 11], [9, 98, 13]))  # Output: [ 3 14  1]
+    print("GCD of all:", gcd_reduce(n * 6 for n in range(1, 10_000)))  # Output: 6
+    print("Shared factors:", batch_gcd([3 * 5, 5 * 7, 11 * 13, 17 * 19, 19 * 23]))
+    # Output: [5, 5, 1, 19, 19]
+
+    print("GCD of 56 and 98:", lehmer_gcd(56, 98))  # Output: 14
+    print("Extended GCD of 240 and 46:", extended_gcd(240, 46))  # Output: (2, -9, 47)
+    print("Inverse of 3 mod 11:", mod_inverse(3, 11))  # Output: 4
+    benchmark_gcd()
@@ -1,4 +1,55 @@
+"""
+This module provides functions to check whether numbers are prime:
+- prime_number: counts every factor of n, O(n).
+- prime_number_optimized: counts factor pairs up to sqrt(n), O(sqrt(n)).
+- primes_in_range: segmented Sieve of Eratosthenes over [lo, hi).
+- iter_primes: unbounded prime generator built on the same segments.
+- is_prime_many: bulk primality check for many values at once.
+- is_prime: single-value check using Miller-Rabin (deterministic below 2^64)
+  and Baillie-PSW above that, after trial division by small primes.
+- build_prime_bitset / PrimeBitset: an odd-only prime bitset saved to a
+  versioned file and opened through mmap, so a check is one bit lookup and
+  all worker processes share the same page cache.
+
+The sieve functions work on bytearray segments of SEGMENT_SIZE bytes. The base
+primes up to sqrt(hi) are themselves built with the segmented sieve and kept in
+a compact array('I'); ranges much narrower than sqrt(hi) skip them entirely and
+test each candidate with is_prime, so memory stays flat however high the range goes.
+"""
+import itertools
 import math
+from array import array
+import mmap
+import os
+import struct
+
+SEGMENT_SIZE = 1 << 15  # 32 KiB, fits comfortably in L1/L2 cache
+
+# Values at or above this are always checked with is_prime: above 2^32 the
+# base primes up to sqrt(n) no longer pay off against a few modular powers.
+BULK_SIEVE_LIMIT = 1 << 32
+
+# is_prime_many sieves a segment only if it holds at least one value per this
+# many base primes; one is_prime call costs about as much as looping over
+# that many base primes in _sieve_segment.
+SIEVE_PAYOFF = 16
+
+SMALL_PRIMES = (
+    2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71,
+    73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151,
+    157, 163, 167, 173, 179, 181, 191, 193, 197, 199,
+)
+
+# These bases make Miller-Rabin deterministic for every n < 3.3 * 10^24,
+# which covers the whole 64-bit range.
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Bitset file layout: magic, format version, limit, padding to 24 bytes,
+# then bit i (little-endian within each byte) is set when 2 * i + 1 is prime.
+BITSET_MAGIC = b"PRIMEBIT"
+BITSET_VERSION = 1
+BITSET_HEADER = struct.Struct("<8sIQ4x")
+FLAGS_TO_BITS = bytes.maketrans(b"\x00\x01", b"01")
 
 
 def prime_number(n: int) -> bool:
@@ -50,6 +101,433 @@ def prime_number_optimized(n: int) -> bool:
     return count == 2
 
 
+def _simple_sieve(limit: int) -> array:
+    """
+    Return all primes <= limit using a plain Sieve of Eratosthenes.
+    Only used for the small seed primes (up to limit^(1/4) of the range).
+
+    :param limit: Upper bound (inclusive).
+    :return: array('I') of primes up to limit.
+    """
+    if limit < 2:
+        return array("I")
+
+    sieve = bytearray(b"\x01") * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+
+    return array("I", itertools.compress(range(limit + 1), sieve))
+
+
+def _base_primes(limit: int) -> array:
+    """
+    Return all primes <= limit, built with the segmented sieve itself.
+
+    Only the seed primes up to sqrt(limit) need a plain sieve; the rest is
+    sieved one SEGMENT_SIZE block at a time, and the primes are stored in
+    an array('I') (4 bytes each) instead of a list of Python ints.
+
+    :param limit: Upper bound (inclusive), below 2^32.
+    :return: array('I') of primes up to limit.
+    """
+    seed_primes = _simple_sieve(math.isqrt(limit))
+    primes = array("I")
+
+    for seg_lo in range(0, limit + 1, SEGMENT_SIZE):
+        seg_hi = min(seg_lo + SEGMENT_SIZE, limit + 1)
+        segment = _sieve_segment(seg_lo, seg_hi, seed_primes)
+        primes.extend(itertools.compress(range(seg_lo, seg_hi), segment))
+
+    return primes
+
+
+def _primes_by_testing(lo: int, hi: int) -> list[int]:
+    """
+    Return the primes in [lo, hi) by testing each odd candidate with is_prime.
+    Used for windows too narrow to repay building the base primes.
+    """
+    primes = [2] if lo <= 2 < hi else []
+    primes.extend(n for n in range(max(lo, 3) | 1, hi, 2) if is_prime(n))
+    return primes
+
+
+def _sieve_segment(lo: int, hi: int, base_primes: array) -> bytearray:
+    """
+    Sieve the segment [lo, hi) with the given base primes.
+
+    :param lo: Start of the segment (inclusive).
+    :param hi: End of the segment (exclusive).
+    :param base_primes: All primes up to at least sqrt(hi - 1).
+    :return: bytearray where index i is 1 if lo + i is prime.
+    """
+    size = hi - lo
+    segment = bytearray(b"\x01") * size
+
+    for p in base_primes:
+        if p * p >= hi:
+            break
+        start = max(p * p, (lo + p - 1) // p * p) - lo
+        if start < size:
+            segment[start::p] = bytes((size - 1 - start) // p + 1)
+
+    for i in range(lo, min(hi, 2)):
+        segment[i - lo] = 0
+
+    return segment
+
+
+def primes_in_range(lo: int, hi: int) -> list[int]:
+    """
+    Return all primes in [lo, hi) using a segmented Sieve of Eratosthenes.
+
+    Windows narrower than sqrt(hi) are not sieved: building the base primes
+    would cost more than running is_prime on every candidate.
+
+    Time complexity: O((hi - lo) log log hi + sqrt(hi)), or
+    O((hi - lo) log^3 hi) for narrow windows.
+    Space complexity: O(sqrt(hi) / log(hi) + SEGMENT_SIZE), or O(1) extra
+    for narrow windows.
+
+    :param lo: Start of the range (inclusive).
+    :param hi: End of the range (exclusive).
+    :return: List of primes in ascending order.
+    """
+    lo = max(lo, 0)
+    if hi <= lo:
+        return []
+
+    root = math.isqrt(hi - 1)
+    if hi - lo < root:
+        return _primes_by_testing(lo, hi)
+
+    base_primes = _base_primes(root)
+    primes = []
+
+    for seg_lo in range(lo, hi, SEGMENT_SIZE):
+        seg_hi = min(seg_lo + SEGMENT_SIZE, hi)
+        segment = _sieve_segment(seg_lo, seg_hi, base_primes)
+        primes.extend(itertools.compress(range(seg_lo, seg_hi), segment))
+
+    return primes
+
+
+def iter_primes(start: int = 2):
+    """
+    Yield primes >= start in ascending order, without an upper bound.
+
+    The base primes are regrown whenever the next segment needs them, so
+    only one segment of SEGMENT_SIZE bytes is alive at any time. Once sqrt
+    of the segment end exceeds SEGMENT_SIZE, sieving a segment would loop
+    over more base primes than it has candidates, so from there on each
+    candidate is tested with is_prime and the base primes stop growing.
+
+    :param start: Smallest value to consider.
+    :return: Generator of primes.
+    """
+    seg_lo = max(start, 0)
+    base_limit = 0
+    base_primes = array("I")
+
+    while True:
+        seg_hi = seg_lo + SEGMENT_SIZE
+        needed = math.isqrt(seg_hi - 1)
+        if needed > SEGMENT_SIZE:
+            yield from _primes_by_testing(seg_lo, seg_hi)
+        else:
+            if needed > base_limit:
+                base_limit = min(max(needed, 2 * base_limit), SEGMENT_SIZE)
+                base_primes = _base_primes(base_limit)
+            segment = _sieve_segment(seg_lo, seg_hi, base_primes)
+            yield from itertools.compress(range(seg_lo, seg_hi), segment)
+
+        seg_lo = seg_hi
+
+
+def is_prime_many(values) -> list[bool]:
+    """
+    Check primality of many values at once.
+
+    The values are sorted and grouped into segments of SEGMENT_SIZE starting
+    at the smallest value not yet covered. A segment is sieved only when it
+    holds enough values to repay the loop over the base primes up to its
+    sqrt (about SIEVE_PAYOFF base primes per value); the values of sparse
+    segments, and all values at or above BULK_SIEVE_LIMIT, go through is_prime.
+
+    Time complexity: O(k log k + s * (SEGMENT_SIZE + pi(sqrt(m))) + t log^3 m),
+    where k is the number of values, s the number of sieved segments, t the
+    number of values tested individually and m the largest value.
+
+    :param values: Iterable (list, array, ...) of integers.
+    :return: List of booleans in the same order as values.
+    """
+    values = [int(v) for v in values]
+    result = [False] * len(values)
+    order = sorted(
+        (i for i, v in enumerate(values) if 2 <= v < BULK_SIEVE_LIMIT),
+        key=values.__getitem__,
+    )
+
+    # Group the sorted values into segments and decide how to check each one.
+    groups = []
+    position = 0
+    while position < len(order):
+        seg_lo = values[order[position]]
+        group_end = position
+        while group_end < len(order) and values[order[group_end]] < seg_lo + SEGMENT_SIZE:
+            group_end += 1
+        groups.append((seg_lo, order[position:group_end]))
+        position = group_end
+
+    sieved = []
+    tested = []
+    for seg_lo, members in groups:
+        root = math.isqrt(seg_lo + SEGMENT_SIZE - 1)
+        base_prime_count = root / max(math.log(root), 1)  # pi(root), roughly
+        if len(members) * SIEVE_PAYOFF >= base_prime_count:
+            sieved.append((seg_lo, members))
+        else:
+            tested.extend(members)
+
+    if sieved:
+        base_primes = _base_primes(math.isqrt(sieved[-1][0] + SEGMENT_SIZE - 1))
+        for seg_lo, members in sieved:
+            segment = _sieve_segment(seg_lo, seg_lo + SEGMENT_SIZE, base_primes)
+            for idx in members:
+                result[idx] = bool(segment[values[idx] - seg_lo])
+
+    for idx in tested:
+        result[idx] = is_prime(values[idx])
+    for idx, v in enumerate(values):
+        if v >= BULK_SIEVE_LIMIT:
+            result[idx] = is_prime(v)
+
+    return result
+
+
+def _miller_rabin(n: int, d: int, s: int, a: int) -> bool:
+    """
+    Run one strong probable-prime round of Miller-Rabin.
+
+    :param n: Odd integer > 2, with n - 1 == d * 2^s and d odd.
+    :param d: Odd part of n - 1.
+    :param s: Power of two in n - 1.
+    :param a: Witness base.
+    :return: True if n is a strong probable prime to base a.
+    """
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+
+    return False
+
+
+def _jacobi(a: int, n: int) -> int:
+    """
+    Compute the Jacobi symbol (a / n) for odd n > 0.
+
+    :param a: Any integer.
+    :param n: Odd positive integer.
+    :return: -1, 0 or 1.
+    """
+    a %= n
+    result = 1
+
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+
+    return result if n == 1 else 0
+
+
+def _strong_lucas(n: int) -> bool:
+    """
+    Strong Lucas probable-prime test with Selfridge's parameters.
+
+    :param n: Odd integer > 2 that is not divisible by a small prime.
+    :return: True if n is a strong Lucas probable prime.
+    """
+    root = math.isqrt(n)
+    if root * root == n:
+        return False
+
+    # Find the first D in 5, -7, 9, -11, ... with (D / n) == -1.
+    d_param = 5
+    while True:
+        jacobi = _jacobi(d_param, n)
+        if jacobi == -1:
+            break
+        if jacobi == 0 and abs(d_param) != n:
+            return False
+        d_param = -d_param - 2 if d_param > 0 else -d_param + 2
+
+    p_param = 1
+    q_param = (1 - d_param) // 4
+
+    d = n + 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    # Walk the bits of d computing U_k, V_k and Q^k modulo n.
+    u, v, q_k = 1, p_param, q_param % n
+    for bit in bin(d)[3:]:
+        u, v = u * v % n, (v * v - 2 * q_k) % n
+        q_k = q_k * q_k % n
+        if bit == "1":
+            u, v = (p_param * u + v) % n, (d_param * u + p_param * v) % n
+            if u % 2:
+                u += n
+            if v % 2:
+                v += n
+            u, v = u // 2, v // 2
+            q_k = q_k * q_param % n
+
+    if u == 0 or v == 0:
+        return True
+
+    for _ in range(s - 1):
+        v = (v * v - 2 * q_k) % n
+        if v == 0:
+            return True
+        q_k = q_k * q_k % n
+
+    return False
+
+
+def is_prime(n: int) -> bool:
+    """
+    Check if a number is prime without scanning up to sqrt(n).
+
+    Small factors are removed by trial division first. Below 2^64 a
+    Miller-Rabin test with fixed bases gives an exact answer; above that
+    the Baillie-PSW test (Miller-Rabin base 2 plus a strong Lucas test)
+    is used, which has no known counterexample.
+
+    Time complexity: O(log^3 n)
+
+    :param n: An integer to check for primality.
+    :return: True if n is prime, False otherwise.
+    """
+    if n < 2:
+        return False
+
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    if n < 1 << 64:
+        return all(_miller_rabin(n, d, s, a) for a in MILLER_RABIN_BASES)
+
+    return _miller_rabin(n, d, s, 2) and _strong_lucas(n)
+
+
+def build_prime_bitset(path: str, limit: int) -> None:
+    """
+    Sieve all primes up to limit and save them as an odd-only bitset file.
+
+    Segments of 16 * SEGMENT_SIZE numbers are sieved and packed to bits one
+    at a time, so building needs no more memory than the segmented sieve.
+    The file is written next to path and renamed into place, so readers
+    never see a half-written bitset.
+
+    Time complexity: O(limit log log limit)
+
+    :param path: Destination file.
+    :param limit: Largest number the bitset answers for.
+    """
+    base_primes = _base_primes(math.isqrt(limit))
+    step = 16 * SEGMENT_SIZE  # a multiple of 16 numbers packs into whole bytes
+    temp_path = f"{path}.tmp{os.getpid()}"
+
+    with open(temp_path, "wb") as file:
+        file.write(BITSET_HEADER.pack(BITSET_MAGIC, BITSET_VERSION, limit))
+        for seg_lo in range(0, limit + 1, step):
+            seg_hi = min(seg_lo + step, limit + 1)
+            odd_flags = bytes(_sieve_segment(seg_lo, seg_hi, base_primes)[1::2])
+            odd_flags += bytes(-len(odd_flags) % 8)
+            bits = int(odd_flags.translate(FLAGS_TO_BITS)[::-1] or b"0", 2)
+            file.write(bits.to_bytes(len(odd_flags) // 8, "little"))
+
+    os.replace(temp_path, path)
+
+
+class PrimeBitset:
+    """
+    Read-only view of a bitset file written by build_prime_bitset.
+
+    The file is mapped with mmap and read through a memoryview, so opening
+    it copies nothing and processes that open the same file share its pages.
+
+    Methods
+    -------
+    is_prime(n): Returns True if n is prime, for 0 <= n <= limit.
+    close(): Releases the mapping.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens and validates the bitset file at path.
+        """
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, limit = BITSET_HEADER.unpack_from(self.mmap)
+        if magic != BITSET_MAGIC or version != BITSET_VERSION:
+            self.mmap.close()
+            raise ValueError(f"{path} is not a version {BITSET_VERSION} prime bitset")
+
+        self.limit = limit
+        self.bits = memoryview(self.mmap)[BITSET_HEADER.size:]
+
+    def is_prime(self, n: int) -> bool:
+        """
+        Check if n is prime with a single bit lookup.
+        Time complexity: O(1)
+        """
+        if n > self.limit:
+            raise ValueError(f"n must be <= {self.limit}, got {n}")
+        if n < 3 or n % 2 == 0:
+            return n == 2
+
+        index = n >> 1
+        return bool(self.bits[index >> 3] >> (index & 7) & 1)
+
+    def close(self) -> None:
+        """
+        Releases the memoryview and the mapping.
+        """
+        self.bits.release()
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 if __name__ == "__main__":
     print("Is prime number:", prime_number(16))   # True
     print("Is prime number:", prime_number_optimized(16))   # True
@@ -62,3 +540,27 @@ if __name__ == "__main__":
     # print("Is prime number:", prime_number_optimized(3))   # True
     # print("Is prime number:", prime_number_optimized(4))   # False
     # print("Is prime number:", prime_number_optimized(13))  # True
+
+    print("Primes in [100, 150):", primes_in_range(100, 150))
+    # Output: [101, 103, 107, 109, 113, 127, 131, 137, 139, 149]
+
+    prime_stream = iter_primes(10**9)
+    print("First primes above 10^9:", [next(prime_stream) for _ in range(3)])
+    # Output: [1000000007, 1000000009, 1000000021]
+
+    print("Bulk check:", is_prime_many([2, 15, 97, 1000003, 1, 0, -7]))
+    # Output: [True, False, True, True, False, False, False]
+
+    print("Is prime number:", is_prime(18446744073709551557))  # True
+    print("Is prime number:", is_prime(3215031751))  # False
+    print("Is prime number:", is_prime(2**127 - 1))  # True
+    print("Is prime number:", is_prime(2**127 + 1))  # False
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bitset_path = os.path.join(tmp_dir, "primes.bin")
+        build_prime_bitset(bitset_path, 10**6)
+        with PrimeBitset(bitset_path) as bitset:
+            print("Is prime number:", bitset.is_prime(999983))  # True
+            print("Is prime number:", bitset.is_prime(999981))  # False
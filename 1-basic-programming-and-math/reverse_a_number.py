@@ -1,8 +1,12 @@
 """
 Module to reverse a 32-bit signed integer safely.
+
+reverse_number_many does the same for a whole NumPy array at once, for
+16, 32 or 64-bit signed results.
 """
 
 import math
+import time
 
 
 def reverse_number(n: int) -> int:
@@ -43,6 +47,76 @@ def reverse_number(n: int) -> int:
     return result
 
 
+def reverse_number_many(values, bits: int = 32):
+    """
+    Reverses the digits of every integer in an array.
+
+    Digits are reversed on unsigned 64-bit magnitudes (a reversed int64 has
+    at most 19 digits, so it always fits), then every element outside the
+    signed range of the given bit width is masked to 0, like reverse_number.
+
+    Time complexity: O(k * d) for k values of at most d digits.
+
+    :param values: Array-like of integers that fit in int64.
+    :param bits: Width of the signed result: 16, 32 or 64.
+    :return: NumPy array of dtype int<bits> with the reversed values.
+    """
+    import numpy as np
+
+    if bits not in (16, 32, 64):
+        raise ValueError(f"bits must be 16, 32 or 64, got {bits}")
+
+    numbers = np.asarray(values, dtype=np.int64)
+    negative = numbers < 0
+    # Two's complement magnitude, also correct for -2^63.
+    magnitude = np.where(negative, ~numbers.view(np.uint64) + np.uint64(1),
+                         numbers.view(np.uint64))
+
+    ten = np.uint64(10)
+    reversed_magnitude = np.zeros_like(magnitude)
+    while True:
+        active = magnitude != 0
+        if not active.any():
+            break
+        magnitude, last_digit = np.divmod(magnitude, ten)
+        reversed_magnitude = np.where(
+            active, reversed_magnitude * ten + last_digit, reversed_magnitude
+        )
+
+    limit_max = np.uint64(2 ** (bits - 1) - 1)
+    overflow = np.where(negative, reversed_magnitude > limit_max + np.uint64(1),
+                        reversed_magnitude > limit_max)
+    reversed_magnitude[overflow] = 0
+
+    result = reversed_magnitude.view(np.int64)
+    result = np.where(negative, -result, result)
+    return result.astype(f"int{bits}")
+
+
+def benchmark_reverse_number(size: int = 200_000) -> None:
+    """
+    Compare reverse_number in a Python loop against reverse_number_many.
+
+    :param size: Number of random values to reverse.
+    """
+    import numpy as np
+
+    values = np.random.default_rng(0).integers(-(2**31), 2**31, size, dtype=np.int64)
+    scalar_values = values.tolist()
+
+    start = time.perf_counter()
+    looped = [reverse_number(n) for n in scalar_values]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = reverse_number_many(values, bits=32)
+    batch_time = time.perf_counter() - start
+
+    assert looped == batched.tolist()
+    print(f"reverse_number loop:  {size / loop_time:,.0f} values/s")
+    print(f"reverse_number_many:  {size / batch_time:,.0f} values/s")
+
+
 if __name__ == "__main__":
     print("Reversed number:", reverse_number(8463847412))
     print("Reversed number:", reverse_number(7463847412))
@@ -50,3 +124,9 @@ if __name__ == "__main__":
     print("Reversed number:", reverse_number(-8463847412))
     print("Reversed number:", reverse_number(-9463847412))
     print("Reversed number:", reverse_number(-8563847412))
+
+    print("Reversed numbers:", reverse_number_many([8463847412, -8463847412, 7463847412, 120]))
+    # Output: [          0 -2147483648  2147483647          21]
+    print("Reversed numbers:", reverse_number_many([123, -4567, 32767], bits=16))
+    # Output: [  321 -7654     0]
+    benchmark_reverse_number()
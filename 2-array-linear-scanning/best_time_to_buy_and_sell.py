@@ -7,11 +7,22 @@ and sell on another day after the buying day to maximize profit.
 
 Functions:
 - max_profit(prices): Computes the maximum possible profit from a list of prices.
+- max_profit_many(prices): Computes the best profit and its buy/sell days for every
+  row of a 2D NumPy price matrix (tickers x time) at once.
+- max_profit_file(path): Best trade over a flat binary float file, scanned in blocks
+  through numpy.memmap without reading the whole file into memory.
+- max_profit_k_transactions(prices, k, fee): Best profit with at most k buy/sell pairs.
+- max_profit_unlimited(prices, fee): Best profit with any number of buy/sell pairs.
+- max_profit_k_transactions_many / max_profit_unlimited_many: The same for every row
+  of a 2D NumPy price matrix at once.
+- StockProfitTracker: Online version of max_profit that takes one tick at a time,
+  optionally restricted to the last W ticks.
 
 Example:
     prices = [7, 1, 5, 3, 6, 4]
     print(max_profit(prices))  # Output: 5 (Buy at 1, sell at 6)
 """
+import os
 
 
 def max_profit(prices):
@@ -31,6 +42,346 @@ def max_profit(prices):
     return profit
 
 
+def max_profit_many(prices, chunk_size=1 << 16):
+    """
+    Best single trade for every ticker of a 2D price matrix.
+
+    Each row is one ticker. The time axis is processed in chunks of chunk_size
+    columns: within a chunk np.minimum.accumulate gives the running buying
+    price, and the running minimum (and its day) is carried to the next chunk,
+    so the whole matrix is scanned once with O(tickers * chunk_size) extra memory.
+
+    Time complexity: O(tickers * days)
+
+    :type prices: 2D array-like of float32 or float64 (other dtypes become float64)
+    :type chunk_size: int
+    :rtype: Tuple[ndarray, ndarray, ndarray] — profit, buy day and sell day per row;
+        the days are -1 where no trade makes a profit.
+    """
+    import numpy as np
+
+    prices = np.asarray(prices)
+    if prices.dtype not in (np.float32, np.float64):
+        prices = prices.astype(np.float64)
+    tickers, days = prices.shape
+
+    best_profit = np.zeros(tickers, dtype=prices.dtype)
+    buy_day = np.full(tickers, -1, dtype=np.int64)
+    sell_day = np.full(tickers, -1, dtype=np.int64)
+    buying_price = np.full(tickers, np.inf, dtype=prices.dtype)
+    buying_day = np.full(tickers, -1, dtype=np.int64)
+    rows = np.arange(tickers)
+
+    for start in range(0, days, chunk_size):
+        chunk = prices[:, start:start + chunk_size]
+        chunk_min = np.minimum.accumulate(chunk, axis=1)
+        running_min = np.minimum(chunk_min, buying_price[:, None])
+
+        profits = chunk - running_min
+        best_in_chunk = profits.argmax(axis=1)
+        chunk_profit = profits[rows, best_in_chunk]
+        improved = chunk_profit > best_profit
+
+        if improved.any():
+            # Buy day for the best sell day: the carried minimum, unless the
+            # chunk itself dipped lower before that day.
+            before_sell = np.arange(chunk.shape[1]) <= best_in_chunk[:, None]
+            dip_day = np.where(before_sell, chunk, np.inf).argmin(axis=1) + start
+            dips_lower = chunk_min[rows, best_in_chunk] < buying_price
+            buy = np.where(dips_lower, dip_day, buying_day)
+
+            best_profit[improved] = chunk_profit[improved]
+            buy_day[improved] = buy[improved]
+            sell_day[improved] = best_in_chunk[improved] + start
+
+        lower = chunk_min[:, -1] < buying_price
+        buying_day[lower] = chunk.argmin(axis=1)[lower] + start
+        buying_price[lower] = chunk_min[lower, -1]
+
+    return best_profit, buy_day, sell_day
+
+
+def max_profit_file(path, dtype="<f8", block_size=1 << 20):
+    """
+    Best single trade over a flat binary file of prices.
+
+    The file is opened with numpy.memmap and handed to max_profit_many as a
+    one-row matrix, which scans it block by block and carries the running
+    minimum across block edges; only one block is in memory at a time.
+
+    Time complexity: O(n)
+    Space complexity: O(block_size)
+
+    :type path: str
+    :type dtype: str — native-endian float32 or float64 (a different dtype is
+        converted and therefore copied).
+    :type block_size: int — prices per block.
+    :rtype: Tuple[float, int, int] — profit, buy day, sell day (-1 without a trade).
+    """
+    import numpy as np
+
+    if os.path.getsize(path) < np.dtype(dtype).itemsize:
+        return 0.0, -1, -1
+
+    prices = np.memmap(path, dtype=dtype, mode="r")
+    profit, buy_day, sell_day = max_profit_many(prices.reshape(1, -1), chunk_size=block_size)
+    return profit[0].item(), int(buy_day[0]), int(sell_day[0])
+
+
+def max_profit_unlimited(prices, fee=0):
+    """
+    Best profit with any number of non-overlapping trades, paying fee per sale.
+    Time complexity: O(n)
+    Space complexity: O(1)
+
+    :type prices: List[float]
+    :type fee: float
+    :rtype: float
+    """
+
+    cash = 0
+    holding = float('-inf')
+
+    for current_price in prices:
+        holding = max(holding, cash - current_price)
+        cash = max(cash, holding + current_price - fee)
+
+    return cash
+
+
+def max_profit_k_transactions(prices, k, fee=0):
+    """
+    Best profit with at most k non-overlapping trades, paying fee per sale.
+
+    holding[j] is the best balance while holding the j-th share bought and
+    cash[j] the best balance after the j-th sale; both are updated once per day.
+    Falls back to max_profit_unlimited when k >= n / 2, since the limit can
+    then never be reached.
+
+    Time complexity: O(n * k)
+    Space complexity: O(k)
+
+    :type prices: List[float]
+    :type k: int
+    :type fee: float
+    :rtype: float
+    """
+
+    if k <= 0:
+        return 0
+    if 2 * k >= len(prices):
+        return max_profit_unlimited(prices, fee)
+
+    holding = [float('-inf')] * k
+    cash = [0] * k
+
+    for current_price in prices:
+        for j in range(k):
+            previous_cash = cash[j - 1] if j else 0
+            holding[j] = max(holding[j], previous_cash - current_price)
+            cash[j] = max(cash[j], holding[j] + current_price - fee)
+
+    return cash[-1]
+
+
+def max_profit_unlimited_many(prices, fee=0):
+    """
+    max_profit_unlimited for every row (ticker) of a 2D price matrix.
+    The loop runs over days; each step updates all tickers at once.
+
+    Time complexity: O(tickers * days)
+
+    :type prices: 2D array-like, tickers x days
+    :type fee: float
+    :rtype: ndarray — best profit per ticker.
+    """
+    import numpy as np
+
+    prices = np.asarray(prices, dtype=np.float64)
+    cash = np.zeros(prices.shape[0])
+    holding = np.full(prices.shape[0], -np.inf)
+
+    for current_price in prices.T:
+        np.maximum(holding, cash - current_price, out=holding)
+        np.maximum(cash, holding + current_price - fee, out=cash)
+
+    return cash
+
+
+def max_profit_k_transactions_many(prices, k, fee=0):
+    """
+    max_profit_k_transactions for every row (ticker) of a 2D price matrix.
+
+    The state is two (tickers x k) arrays. Each day, every trade j buys from the
+    previous day's balance after sale j - 1; selling and re-buying on the same
+    day never pays off, so the answer matches the scalar version.
+
+    Time complexity: O(tickers * days * k)
+    Space complexity: O(tickers * k)
+
+    :type prices: 2D array-like, tickers x days
+    :type k: int
+    :type fee: float
+    :rtype: ndarray — best profit per ticker.
+    """
+    import numpy as np
+
+    prices = np.asarray(prices, dtype=np.float64)
+    tickers, days = prices.shape
+    if k <= 0:
+        return np.zeros(tickers)
+    if 2 * k >= days:
+        return max_profit_unlimited_many(prices, fee)
+
+    holding = np.full((tickers, k), -np.inf)
+    cash = np.zeros((tickers, k + 1))  # column 0 is the balance before any trade
+
+    for current_price in prices.T:
+        current_price = current_price[:, None]
+        np.maximum(holding, cash[:, :-1] - current_price, out=holding)
+        np.maximum(cash[:, 1:], holding + current_price - fee, out=cash[:, 1:])
+
+    return cash[:, -1]
+
+
+def _combine_trades(older, newer):
+    """
+    Combine the trade summaries of two consecutive runs of ticks.
+
+    A summary is (min price, its tick, max price, its tick, best profit, buy tick,
+    sell tick). The best trade of the combined run is the best of either run, or
+    buying at the older run's minimum and selling at the newer run's maximum.
+    """
+    if older is None:
+        return newer
+    if newer is None:
+        return older
+
+    min_price, min_tick = older[0], older[1]
+    if newer[0] < min_price:
+        min_price, min_tick = newer[0], newer[1]
+    max_price, max_tick = newer[2], newer[3]
+    if older[2] > max_price:
+        max_price, max_tick = older[2], older[3]
+
+    best = older[4:] if older[4] >= newer[4] else newer[4:]
+    crossing = newer[2] - older[0]
+    if crossing > best[0]:
+        best = (crossing, older[1], newer[3])
+
+    return (min_price, min_tick, max_price, max_tick) + tuple(best)
+
+
+class StockProfitTracker:
+    """
+    Online max_profit: feed prices one tick at a time and read the best trade.
+
+    Without a window it keeps the lowest price so far and the best trade, the
+    same way max_profit does. With a window W it reports the best trade whose
+    buy and sell ticks both lie in the last W ticks. Every tick then becomes a
+    trade summary in a two-stack queue; since combining summaries is
+    associative, pushing the newest tick, dropping the oldest one and reading
+    the best trade of the whole window are all amortized O(1).
+
+    Methods
+    -------
+    update(price): Adds the next tick and returns the current best profit.
+    best_trade(): Returns (profit, buy tick, sell tick); ticks are -1 without a trade.
+    """
+
+    def __init__(self, window=None):
+        """
+        Initializes the tracker; window is the number of most recent ticks
+        to consider, or None for the whole history.
+        """
+        if window is not None and window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.window = window
+        self.tick = -1
+
+        # Whole-history mode.
+        self.buying_price = float('inf')
+        self.buying_tick = -1
+        self.trade = (0, -1, -1)
+
+        # Window mode: new ticks are pushed on `back`, old ones popped from `front`.
+        # Entries are (tick summary, summary of the entry and everything pushed
+        # after it on the same stack).
+        self.front = []
+        self.back = []
+
+    def update(self, price):
+        """
+        Adds the next price tick.
+        Time complexity: O(1), amortized in window mode.
+
+        :type price: float
+        :rtype: float — best profit after this tick.
+        """
+        self.tick += 1
+
+        if self.window is None:
+            if price < self.buying_price:
+                self.buying_price, self.buying_tick = price, self.tick
+            elif price - self.buying_price > self.trade[0]:
+                self.trade = (price - self.buying_price, self.buying_tick, self.tick)
+            return self.trade[0]
+
+        single = (price, self.tick, price, self.tick, 0, -1, -1)
+        older = self.back[-1][1] if self.back else None
+        self.back.append((single, _combine_trades(older, single)))
+
+        if len(self.front) + len(self.back) > self.window:
+            if not self.front:
+                newer = None
+                while self.back:
+                    single, _ = self.back.pop()
+                    newer = _combine_trades(single, newer)
+                    self.front.append((single, newer))
+            self.front.pop()
+
+        return self.best_trade()[0]
+
+    def best_trade(self):
+        """
+        Time complexity: O(1)
+        :rtype: Tuple[float, int, int] — profit, buy tick, sell tick.
+        """
+        if self.window is None:
+            return self.trade
+
+        older = self.front[-1][1] if self.front else None
+        newer = self.back[-1][1] if self.back else None
+        summary = _combine_trades(older, newer)
+        return tuple(summary[4:]) if summary else (0, -1, -1)
+
+
 if __name__ == "__main__":
     price_list = [7, 1, 5, 3, 6, 4]
     print(max_profit(price_list))  # Output: 5 (Buy on day 2 and sell on day 5)
+
+    price_matrix = [[7, 1, 5, 3, 6, 4], [7, 6, 4, 3, 1, 0], [2, 4, 1, 2, 3, 9]]
+    profit, buy, sell = max_profit_many(price_matrix, chunk_size=4)
+    print(profit, buy, sell)  # Output: [5. 0. 8.] [ 1 -1  2] [ 4 -1  5]
+
+    import tempfile
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        price_path = os.path.join(tmp_dir, "prices.f8")
+        np.array(price_list, dtype="<f8").tofile(price_path)
+        print(max_profit_file(price_path, block_size=2))  # Output: (5.0, 1, 4)
+
+    print(max_profit_k_transactions([3, 2, 6, 5, 0, 3], 2))  # Output: 7
+    print(max_profit_unlimited([1, 3, 2, 8, 4, 9], fee=2))  # Output: 8
+    print(max_profit_k_transactions_many([[3, 2, 6, 5, 0, 3], [1, 3, 2, 8, 4, 9]], 1))
+    # Output: [4. 8.]
+
+    tracker = StockProfitTracker()
+    windowed = StockProfitTracker(window=3)
+    for tick_price in [7, 1, 5, 3, 6, 4]:
+        tracker.update(tick_price)
+        windowed.update(tick_price)
+    print(tracker.best_trade())   # Output: (5, 1, 4)
+    print(windowed.best_trade())  # Output: (3, 3, 4)
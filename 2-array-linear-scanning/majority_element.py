@@ -7,6 +7,12 @@ in the list, where n is the length of the list.
 
 Functions:
 - majority_element(nums): Returns the majority element if it exists, otherwise 0.
+- majority_element_parallel(path): Finds the majority element of a packed binary
+  integer file with a process pool, without loading the file into memory.
+- HeavyHitters(k): Mergeable Misra-Gries summary that finds every element appearing
+  more than n / k times in a stream, using k - 1 counters.
+- RangeMajority(nums): Answers majority queries on subarrays nums[l:r] in O(log n)
+  after O(n) preprocessing.
 
 Example usage:
     num_list = [3, 2, 3]
@@ -15,6 +21,9 @@ Example usage:
     num_list = [2, 2, 1, 1, 1, 2, 2]
     print(majority_element(num_list))  # Output: 2
 """
+import bisect
+import multiprocessing
+import os
 
 
 def majority_element(nums):
@@ -75,6 +84,289 @@ def majority_element_boyer_moor_voting_algorithm(nums):
     return top_candidate
 
 
+def _combine_votes(left_candidate, left_count, right_candidate, right_count):
+    """
+    Combine two Boyer-Moore (candidate, count) pairs into one.
+    """
+    if left_candidate == right_candidate:
+        return left_candidate, left_count + right_count
+    if left_count >= right_count:
+        return left_candidate, left_count - right_count
+    return right_candidate, right_count - left_count
+
+
+def merge_boyer_moore(summaries):
+    """
+    Merge Boyer-Moore (candidate, count) pairs computed on separate chunks.
+    Equal candidates add up, different ones cancel each other out, exactly as
+    the voting algorithm does for single elements.
+
+    :type summaries: Iterable[Tuple[int, int]]
+    :rtype: Tuple[int, int]
+    """
+
+    top_candidate = None
+    count = 0
+
+    for candidate, votes in summaries:
+        top_candidate, count = _combine_votes(top_candidate, count, candidate, votes)
+
+    return top_candidate, count
+
+
+def _chunk_boyer_moore(task):
+    """
+    Pool worker: Boyer-Moore summary of values[start:stop] of a memory-mapped file.
+
+    The summary is computed vectorized: a majority, if any, is the median, so
+    the candidate comes from np.partition and its votes are the copies left
+    over after pairing it off against every other element.
+    """
+    import numpy as np
+
+    path, dtype, start, stop = task
+    chunk = np.memmap(path, dtype=dtype, mode="r")[start:stop]
+    size = len(chunk)
+    candidate = np.partition(chunk, size // 2)[size // 2]
+    occurrences = int(np.count_nonzero(chunk == candidate))
+
+    if 2 * occurrences > size:
+        return candidate.item(), 2 * occurrences - size
+    return candidate.item(), size % 2
+
+
+def _chunk_count(task):
+    """
+    Pool worker: count occurrences of a value in values[start:stop] of a memory-mapped file.
+    """
+    import numpy as np
+
+    path, dtype, start, stop, value = task
+    chunk = np.memmap(path, dtype=dtype, mode="r")[start:stop]
+    return int(np.count_nonzero(chunk == value))
+
+
+def majority_element_parallel(path, dtype="<i8", workers=None, chunk_size=1 << 22):
+    """
+    Find the majority element of a flat binary file of integers.
+
+    Every worker memory-maps the file and summarizes its own chunks with
+    Boyer-Moore; the summaries are merged into a single candidate, and a
+    second parallel pass counts the candidate to confirm it is a majority.
+    Only one chunk per worker is in memory at a time.
+
+    Time complexity: O(n / workers)
+    Space complexity: O(workers * chunk_size)
+
+    :type path: str
+    :type dtype: str — NumPy dtype of the stored values.
+    :type workers: int — defaults to the number of CPUs.
+    :type chunk_size: int — values per task.
+    :rtype: int or None if there is no majority element.
+    """
+    import numpy as np
+
+    total = os.path.getsize(path) // np.dtype(dtype).itemsize
+    if total == 0:
+        return None
+
+    bounds = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+
+    with multiprocessing.Pool(workers) as pool:
+        summaries = pool.map(_chunk_boyer_moore, [(path, dtype, lo, hi) for lo, hi in bounds])
+        candidate, _ = merge_boyer_moore(summaries)
+        occurrences = sum(pool.map(
+            _chunk_count, [(path, dtype, lo, hi, candidate) for lo, hi in bounds]
+        ))
+
+    return candidate if occurrences > total / 2 else None
+
+
+class HeavyHitters:
+    """
+    Misra-Gries summary: Boyer-Moore voting generalized to k - 1 candidates.
+
+    Every element that appears more than n / k times in the stream is
+    guaranteed to be among the candidates, and each stored count
+    underestimates the true count by at most n / k. The summary uses O(k)
+    memory however long the stream is, and summaries of different shards can
+    be merged. With k = 2 it behaves like the Boyer-Moore voting algorithm.
+
+    Methods
+    -------
+    update(item): Counts one occurrence of item.
+    update_many(items): Counts every item of an iterable.
+    merge(other): Folds another summary with the same k into this one.
+    candidates(): Returns the current candidates and their estimated counts.
+    verify(items): Exact second pass returning the true heavy hitters.
+    """
+
+    def __init__(self, k):
+        """
+        Initializes an empty summary keeping at most k - 1 counters.
+        """
+        if k < 2:
+            raise ValueError(f"k must be at least 2, got {k}")
+        self.k = k
+        self.counters = {}
+        self.total = 0
+
+    def update(self, item):
+        """
+        Counts one occurrence of item.
+        Time complexity: O(1) amortized.
+        """
+        self.total += 1
+        counters = self.counters
+
+        if item in counters:
+            counters[item] += 1
+        elif len(counters) < self.k - 1:
+            counters[item] = 1
+        else:
+            # Cancel item against one occurrence of every candidate.
+            for key in list(counters):
+                if counters[key] == 1:
+                    del counters[key]
+                else:
+                    counters[key] -= 1
+
+    def update_many(self, items):
+        """
+        Counts every item of an iterable (list, generator, NumPy array, ...).
+        """
+        update = self.update
+        for item in items:
+            update(item)
+
+    def merge(self, other):
+        """
+        Folds another summary into this one.
+
+        The counters are added up; if more than k - 1 remain, the k-th largest
+        count is subtracted from all of them and non-positive ones are dropped,
+        which keeps the same n / k error bound for the combined stream.
+        """
+        if other.k != self.k:
+            raise ValueError(f"cannot merge summaries with k={self.k} and k={other.k}")
+
+        for item, count in other.counters.items():
+            self.counters[item] = self.counters.get(item, 0) + count
+        self.total += other.total
+
+        if len(self.counters) > self.k - 1:
+            cut = sorted(self.counters.values(), reverse=True)[self.k - 1]
+            self.counters = {
+                item: count - cut for item, count in self.counters.items() if count > cut
+            }
+
+    def candidates(self):
+        """
+        Returns the candidates with their estimated (lower-bound) counts.
+        """
+        return dict(self.counters)
+
+    def verify(self, items):
+        """
+        Counts the candidates exactly over items (the same data the summary
+        was built from) and keeps only those appearing more than n / k times.
+
+        :type items: Iterable
+        :rtype: Dict — element to its exact count.
+        """
+        exact = dict.fromkeys(self.counters, 0)
+        length = 0
+
+        for item in items:
+            length += 1
+            if item in exact:
+                exact[item] += 1
+
+        return {item: count for item, count in exact.items() if count > length / self.k}
+
+
+class RangeMajority:
+    """
+    Majority element queries on subarrays of one fixed list.
+
+    A segment tree stores the Boyer-Moore (candidate, count) pair of every
+    node, so the only possible majority of nums[l:r] is found by combining
+    O(log n) nodes. The candidate is then confirmed by counting its
+    occurrences in [l, r) with binary searches in its sorted position list.
+
+    Methods
+    -------
+    query(left, right): Returns the majority element of nums[left:right], or None.
+    query_many(ranges): Returns query(left, right) for every (left, right) pair.
+    """
+
+    def __init__(self, nums):
+        """
+        Builds the segment tree and the position lists in O(n).
+        """
+        self.length = len(nums)
+        size = 1
+        while size < self.length:
+            size *= 2
+        self.size = size
+
+        self.candidates = [None] * (2 * size)
+        self.counts = [0] * (2 * size)
+        self.positions = {}
+
+        for i, num in enumerate(nums):
+            self.candidates[size + i] = num
+            self.counts[size + i] = 1
+            self.positions.setdefault(num, []).append(i)
+
+        for node in range(size - 1, 0, -1):
+            left, right = 2 * node, 2 * node + 1
+            self.candidates[node], self.counts[node] = _combine_votes(
+                self.candidates[left], self.counts[left],
+                self.candidates[right], self.counts[right],
+            )
+
+    def query(self, left, right):
+        """
+        Time complexity: O(log n)
+        :type left: int — start index (inclusive).
+        :type right: int — end index (exclusive).
+        :rtype: int or None if nums[left:right] has no majority element.
+        """
+        left, right, _ = slice(left, right).indices(self.length)
+        if left >= right:
+            return None
+
+        candidate, count = None, 0
+        low, high = left + self.size, right + self.size
+        while low < high:
+            if low & 1:
+                candidate, count = _combine_votes(
+                    candidate, count, self.candidates[low], self.counts[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                candidate, count = _combine_votes(
+                    candidate, count, self.candidates[high], self.counts[high])
+            low //= 2
+            high //= 2
+
+        if count == 0:
+            return None
+
+        positions = self.positions[candidate]
+        occurrences = bisect.bisect_left(positions, right) - bisect.bisect_left(positions, left)
+        return candidate if 2 * occurrences > right - left else None
+
+    def query_many(self, ranges):
+        """
+        :type ranges: Iterable[Tuple[int, int]] — (left, right) pairs.
+        :rtype: List — query(left, right) for every pair.
+        """
+        query = self.query
+        return [query(left, right) for left, right in ranges]
+
+
 if __name__ == "__main__":
     num_list = [3, 2, 3]
     print(majority_element(num_list))  # Output: 3
@@ -86,3 +378,26 @@ if __name__ == "__main__":
 
     num_list = [1, 2, 3, 2, 2, 2, 6]
     print(majority_element_boyer_moor_voting_algorithm(num_list))  # Output: 2
+
+    stream = [1, 2, 1, 3, 1, 2, 4, 2, 5, 1, 2, 6, 1, 2]
+    hitters = HeavyHitters(3)
+    hitters.update_many(stream[:7])
+    shard = HeavyHitters(3)
+    shard.update_many(stream[7:])
+    hitters.merge(shard)
+    print(hitters.verify(stream))  # Output: {1: 5, 2: 5}
+
+    ranges = RangeMajority([1, 1, 2, 2, 2, 3, 1, 1])
+    print(ranges.query(0, 2))  # Output: 1
+    print(ranges.query_many([(1, 5), (0, 8), (6, 8)]))  # Output: [2, None, 1]
+
+    import tempfile
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        vote_path = os.path.join(tmp_dir, "votes.bin")
+        votes = np.random.default_rng(0).integers(0, 1000, 1_000_000)
+        votes[::2] = 7
+        votes.astype("<i8").tofile(vote_path)
+        print(majority_element_parallel(vote_path, chunk_size=100_000))  # Output: 7
@@ -1,7 +1,29 @@
 """
 Module to find two numbers in a list that sum up to a target value.
 Includes a function `two_sum` and example usage.
+
+`two_sum_stream` works on any iterator instead of a list and reports every
+matching index pair as soon as its second element arrives;
+`two_sum_stream_file` reports the same pairs for a binary integer file,
+matching a whole NumPy chunk at a time against the values read so far.
+
+For huge in-memory int64 arrays, `two_sum_sorted` and `two_sum_sorted_all`
+argsort once and binary-search complements with NumPy instead of building a
+dict of boxed ints.
+
+`TwoSumIndex` is built once from a list and then answers many two-sum
+queries with different targets without rebuilding anything.
+
+`k_sum` generalizes the pair search to 3-sum, 4-sum and any k, returning
+every unique combination of values that adds up to the target.
 """
+import random
+import time
+from collections import deque
+
+# Largest number of distinct-value pairs k_sum tabulates for its
+# meet-in-the-middle 4-sum step; above it, it falls back to plain search.
+K_SUM_PAIR_LIMIT = 1 << 23
 
 
 def two_sum(nums: list[int], target: int) -> list[int]:
@@ -60,6 +82,571 @@ def twoSum(nums, target):
     return []
 
 
+def two_sum_stream(values, target: int, window: int | None = None):
+    """
+    Report every pair of indices (i, j), i < j, with values[i] + values[j] == target,
+    reading values one at a time from any iterable.
+
+    Each pair is yielded as soon as element j arrives. With a window, only the
+    last `window` elements are remembered (pairs with j - i <= window), which
+    bounds memory at O(window) for unbounded streams.
+
+    Time complexity: O(1) per element plus O(1) per reported pair.
+    Space complexity: O(n), or O(window) with a window.
+
+    :param values: Iterable of integers (list, generator, file reader, ...).
+    :param target: Target sum.
+    :param window: Optional maximum distance j - i between paired indices.
+    :return: Generator of (i, j) tuples.
+    """
+    visited = {}
+    if window is None:
+        for j, value in enumerate(values):
+            for i in visited.get(target - value, ()):
+                yield i, j
+            visited.setdefault(value, []).append(j)
+        return
+
+    # Window mode: each value keeps a deque of its in-window indices, and
+    # `recent` remembers arrival order so the oldest index can be expired.
+    recent = deque()
+    for j, value in enumerate(values):
+        while recent and recent[0][0] < j - window:
+            _, old_value = recent.popleft()
+            indices = visited[old_value]
+            indices.popleft()
+            if not indices:
+                del visited[old_value]
+
+        for i in visited.get(target - value, ()):
+            yield i, j
+
+        visited.setdefault(value, deque()).append(j)
+        recent.append((j, value))
+
+
+def read_int_chunks(path: str, dtype: str = "<i8", chunk_size: int = 1 << 20):
+    """
+    Read a flat binary file of integers in NumPy chunks.
+
+    :param path: File of packed integers.
+    :param dtype: NumPy dtype of the stored values.
+    :param chunk_size: Number of values per chunk.
+    :return: Generator of NumPy arrays.
+    """
+    import numpy as np
+
+    with open(path, "rb") as file:
+        while True:
+            chunk = np.fromfile(file, dtype=dtype, count=chunk_size)
+            if chunk.size == 0:
+                return
+            yield chunk
+
+
+def _expand_ranges(lo, hi):
+    """
+    Expand the ranges [lo[k], hi[k]) into (owner k, position) arrays.
+    """
+    import numpy as np
+
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    owners = np.repeat(np.arange(len(lo)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, np.repeat(lo, counts) + offsets
+
+
+def two_sum_stream_file(path: str, target: int, window: int | None = None,
+                        dtype: str = "<i8", chunk_size: int = 1 << 20):
+    """
+    Report the same pairs as two_sum_stream for a binary integer file,
+    doing the lookups for a whole chunk at a time with NumPy.
+
+    The values seen so far are kept sorted by (value, index). For each chunk,
+    the complements of all its values are binary-searched in that history and
+    in the sorted chunk itself, then the chunk is merged into the history.
+    With a window, history older than `window` positions is dropped.
+
+    Time complexity: O(n log c + p) searches for chunk size c and p reported
+    pairs, plus O(h) per chunk to merge into a history of h values.
+    Space complexity: O(n), or O(window + chunk_size) with a window.
+
+    :param path: File of packed integers.
+    :param target: Target sum.
+    :param window: Optional maximum distance j - i between paired indices.
+    :param dtype: NumPy dtype of the stored values.
+    :param chunk_size: Number of values read per chunk.
+    :return: Generator of (i, j) tuples, ordered by j and then i.
+    """
+    import numpy as np
+
+    seen_values = np.empty(0, dtype=np.int64)
+    seen_indices = np.empty(0, dtype=np.int64)
+    base = 0
+
+    for chunk in read_int_chunks(path, dtype, chunk_size):
+        chunk = chunk.astype(np.int64, copy=False)
+        order = np.argsort(chunk, kind="stable")
+        chunk_values = chunk[order]
+        chunk_indices = order + base
+        complements = target - chunk_values
+
+        firsts, seconds = [], []
+        for pool_values, pool_indices in ((seen_values, seen_indices),
+                                          (chunk_values, chunk_indices)):
+            lo = np.searchsorted(pool_values, complements, side="left")
+            hi = np.searchsorted(pool_values, complements, side="right")
+            owners, positions = _expand_ranges(lo, hi)
+            i, j = pool_indices[positions], chunk_indices[owners]
+            keep = i < j
+            if window is not None:
+                keep &= i >= j - window
+            firsts.append(i[keep])
+            seconds.append(j[keep])
+
+        i, j = np.concatenate(firsts), np.concatenate(seconds)
+        ordered = np.lexsort((i, j))
+        yield from zip(i[ordered].tolist(), j[ordered].tolist())
+
+        # Chunk indices are all larger than history indices, so inserting
+        # after equal values keeps the history sorted by (value, index).
+        positions = np.searchsorted(seen_values, chunk_values, side="right")
+        seen_values = np.insert(seen_values, positions, chunk_values)
+        seen_indices = np.insert(seen_indices, positions, chunk_indices)
+        base += len(chunk)
+        if window is not None:
+            keep = seen_indices >= base - window
+            seen_values, seen_indices = seen_values[keep], seen_indices[keep]
+
+
+def _complement_ranges(sorted_nums, target: int, start: int, stop: int):
+    """
+    For sorted positions start..stop-1, find the range [lo, hi) of sorted
+    positions holding the complement target - sorted_nums[k].
+    """
+    import numpy as np
+
+    complements = target - sorted_nums[start:stop]
+    lo = np.searchsorted(sorted_nums, complements, side="left")
+    hi = np.searchsorted(sorted_nums, complements, side="right")
+    return lo, hi
+
+
+def two_sum_sorted(nums, target: int, chunk_size: int = 1 << 20) -> list[int]:
+    """
+    Find two indices of numbers that add up to the target value, using one
+    argsort and chunked binary searches for the complements.
+
+    Time complexity: O(n log n)
+    Space complexity: about 2x the input (sort order and sorted copy), plus
+    O(chunk_size) working arrays.
+
+    :param nums: Array-like of int64 values.
+    :param target: Target sum.
+    :return: [i, j] with i < j and nums[i] + nums[j] == target, or [] if none.
+    """
+    import numpy as np
+
+    values = np.asarray(nums, dtype=np.int64)
+    order = np.argsort(values, kind="stable")
+    sorted_nums = values[order]
+
+    for start in range(0, len(sorted_nums), chunk_size):
+        stop = min(start + chunk_size, len(sorted_nums))
+        lo, hi = _complement_ranges(sorted_nums, target, start, stop)
+        # Pair each position only with a later one, so k never pairs with itself.
+        lo = np.maximum(lo, np.arange(start + 1, stop + 1))
+        found = np.flatnonzero(lo < hi)
+        if found.size:
+            k = start + int(found[0])
+            i, j = int(order[k]), int(order[lo[found[0]]])
+            return [min(i, j), max(i, j)]
+
+    return []
+
+
+def two_sum_sorted_all(nums, target: int, chunk_size: int = 1 << 20):
+    """
+    Find every pair of indices (i, j), i < j, with nums[i] + nums[j] == target.
+
+    Each sorted position k is paired with the later sorted positions holding
+    its complement; those ranges come from searchsorted and are expanded with
+    np.repeat, so there is no Python-level loop per element.
+
+    Time complexity: O(n log n + p) for p reported pairs.
+
+    :param nums: Array-like of int64 values.
+    :param target: Target sum.
+    :return: NumPy int64 array of shape (p, 2), rows (i, j) in ascending order.
+    """
+    import numpy as np
+
+    values = np.asarray(nums, dtype=np.int64)
+    order = np.argsort(values, kind="stable")
+    sorted_nums = values[order]
+    pairs = []
+
+    for start in range(0, len(sorted_nums), chunk_size):
+        stop = min(start + chunk_size, len(sorted_nums))
+        lo, hi = _complement_ranges(sorted_nums, target, start, stop)
+        lo = np.maximum(lo, np.arange(start + 1, stop + 1))
+        counts = np.maximum(hi - lo, 0)
+        total = int(counts.sum())
+        if total == 0:
+            continue
+
+        first = np.repeat(np.arange(start, stop), counts)
+        # Position of each partner: its range start plus its offset in the range.
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = np.repeat(lo, counts) + offsets
+
+        i, j = order[first], order[second]
+        pairs.append(np.column_stack((np.minimum(i, j), np.maximum(i, j))))
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+
+    result = np.concatenate(pairs)
+    return result[np.lexsort((result[:, 1], result[:, 0]))]
+
+
+class TwoSumIndex:
+    """
+    Reusable index over one list for answering two-sum queries for many targets.
+
+    Keeps the distinct values in sorted order and a hash from each value to
+    the indices where it occurs. A query is a two-pointer walk over the
+    sorted values, so nothing has to be built or allocated per query.
+
+    For every target, the pair returned uses the smallest possible value and
+    the first occurrence of each value, so query and query_many agree.
+
+    Methods
+    -------
+    query(target): Returns [i, j] with nums[i] + nums[j] == target, or [].
+    query_many(targets): Returns the answer of query for every target.
+    """
+
+    def __init__(self, nums: list[int]):
+        """
+        Builds the index in O(n log n).
+        """
+        self.indices = {}
+        for i, num in enumerate(nums):
+            self.indices.setdefault(num, []).append(i)
+        self.values = sorted(self.indices)
+
+    def _pair(self, low_value: int, high_value: int) -> list[int]:
+        """
+        Returns the sorted indices of the first occurrences of the two values,
+        or [] when both are the same value and it occurs only once.
+        """
+        if low_value == high_value:
+            positions = self.indices[low_value]
+            return positions[:2] if len(positions) > 1 else []
+
+        i, j = self.indices[low_value][0], self.indices[high_value][0]
+        return [i, j] if i < j else [j, i]
+
+    def query(self, target: int) -> list[int]:
+        """
+        Find two indices of numbers that add up to the target value.
+        Time complexity: O(d) for d distinct values, O(1) when the target
+        is outside the range of possible sums.
+
+        :param target: Target sum.
+        :return: List containing the two indices, or [] if there is none.
+        """
+        values = self.values
+        if not values or target < 2 * values[0] or target > 2 * values[-1]:
+            return []
+
+        low, high = 0, len(values) - 1
+        while low <= high:
+            pair_sum = values[low] + values[high]
+            if pair_sum == target:
+                return self._pair(values[low], values[high])
+            if pair_sum < target:
+                low += 1
+            else:
+                high -= 1
+
+        return []
+
+    def query_many(self, targets) -> list[list[int]]:
+        """
+        Answer query for a batch of targets.
+
+        Loops over the targets only: for each one, the complements of all
+        distinct values are looked up together with np.searchsorted, and the
+        first hit is the pair with the smallest value, as in query.
+
+        Time complexity: O(q) Python iterations for q targets, each doing
+        O(d log d) vectorized work over the d distinct values.
+
+        :param targets: Iterable of target sums.
+        :return: List with the answer of query for each target.
+        """
+        import numpy as np
+
+        targets = [int(target) for target in targets]
+        answers = [[] for _ in range(len(targets))]
+        if not self.values or not targets:
+            return answers
+
+        values = np.asarray(self.values, dtype=np.int64)
+        lows = np.arange(len(values))
+        has_duplicate = np.array([len(self.indices[v]) > 1 for v in self.values])
+        smallest, largest = 2 * self.values[0], 2 * self.values[-1]
+        last = len(values) - 1
+
+        for target_index, target in enumerate(targets):
+            if target < smallest or target > largest:
+                continue
+            # A pair's smaller value is at most target // 2.
+            half = int(np.searchsorted(values, target // 2, side="right"))
+            complements = target - values[:half]
+            positions = np.minimum(np.searchsorted(values, complements), last)
+            found = (values[positions] == complements) & (
+                (positions > lows[:half]) | ((positions == lows[:half]) & has_duplicate[:half])
+            )
+            if found.any():
+                low = int(found.argmax())
+                answers[target_index] = self._pair(self.values[low],
+                                                   self.values[positions[low]])
+
+        return answers
+
+
+def _k_sum_pairs(values, counts, target: int, start: int, used: int, prefix: list, results: list):
+    """
+    Leaf of the k-sum search: append prefix + (a, b) for every pair of
+    distinct-value positions start <= a <= b with a + b == target.
+
+    All candidates for a are checked at once: their complements are looked
+    up with np.searchsorted, which replaces the innermost two-pointer loop.
+
+    :param values: Sorted distinct values (NumPy int64).
+    :param counts: Number of occurrences of each value.
+    :param target: Remaining sum.
+    :param start: First distinct-value position that may be used.
+    :param used: Copies of values[start] already used in prefix.
+    :param prefix: Values chosen so far.
+    :param results: List that receives the value tuples.
+    """
+    import numpy as np
+
+    # a <= b means 2a <= target, and b <= max means a >= target - max.
+    first = int(np.searchsorted(values, target - int(values[-1])))
+    if first > start:
+        start, used = first, 0
+    stop = int(np.searchsorted(values, target // 2, side="right"))
+    if stop <= start:
+        return
+
+    smaller = values[start:stop]
+    complements = target - smaller
+    positions = np.minimum(np.searchsorted(values, complements), len(values) - 1)
+    available = counts[start:stop].copy()
+    available[0] -= used
+    same = positions == np.arange(start, stop)
+    found = (values[positions] == complements) & (available >= np.where(same, 2, 1))
+
+    for a, b in zip(smaller[found].tolist(), complements[found].tolist()):
+        results.append((*prefix, a, b))
+
+
+def _pair_sums(values, counts):
+    """
+    Table of every pair of distinct-value positions p <= q that can be used
+    together (p == q needs two copies), sorted by values[p] + values[q].
+
+    :return: (sums, firsts, seconds) NumPy arrays.
+    """
+    import numpy as np
+
+    firsts, seconds = np.triu_indices(len(values))
+    usable = (firsts != seconds) | (counts[firsts] >= 2)
+    firsts, seconds = firsts[usable], seconds[usable]
+    sums = values[firsts] + values[seconds]
+    order = np.argsort(sums, kind="stable")
+    return sums[order], firsts[order], seconds[order]
+
+
+def _k_sum_quads(values, counts, pairs, target: int, start: int, used: int,
+                 prefix: list, results: list, chunk_size: int = 1 << 16):
+    """
+    Last four values of the k-sum search, by meet in the middle: a quadruple
+    a <= b <= c <= d is a low pair (a, b) plus a high pair (c, d) from the
+    pair-sum table with b <= c, so the high pairs are found by binary search
+    on the sorted sums instead of by two more levels of recursion.
+
+    :param pairs: Table from _pair_sums.
+    :param chunk_size: Low pairs matched at a time, to bound memory.
+    Other parameters are as in _k_sum_pairs.
+    """
+    import numpy as np
+
+    sums, firsts, seconds = pairs
+    available = counts.copy()
+    available[start] -= used
+
+    # The low pair's sum is at most half the target.
+    stop = int(np.searchsorted(sums, target // 2, side="right"))
+    low = np.flatnonzero(firsts[:stop] >= start)
+
+    for chunk_start in range(0, len(low), chunk_size):
+        chunk = low[chunk_start:chunk_start + chunk_size]
+        complements = target - sums[chunk]
+        lo = np.searchsorted(sums, complements, side="left")
+        hi = np.searchsorted(sums, complements, side="right")
+        owners, partners = _expand_ranges(lo, hi)
+        owners = chunk[owners]
+        keep = firsts[partners] >= seconds[owners]
+        quad = np.column_stack((firsts[owners[keep]], seconds[owners[keep]],
+                                firsts[partners[keep]], seconds[partners[keep]]))
+        if not len(quad):
+            continue
+
+        # A value repeated across the two pairs must have enough copies left.
+        enough = np.ones(len(quad), dtype=bool)
+        for column in range(4):
+            copies = (quad == quad[:, column:column + 1]).sum(axis=1)
+            enough &= copies <= available[quad[:, column]]
+
+        for combination in np.unique(values[quad[enough]], axis=0).tolist():
+            results.append((*prefix, *combination))
+
+
+def _k_sum_search(values, counts, target: int, k: int, start: int, used: int,
+                  prefix: list, results: list, pairs=None):
+    """
+    Choose the next value of a k-sum in non-decreasing order and recurse.
+
+    Only values v with k * v <= target (the rest of the tuple is at least v)
+    and v + (k - 1) * max >= target (the rest is at most max) are tried,
+    so whole ranges are pruned with two binary searches. With a pair-sum
+    table, the last four values are found by _k_sum_quads.
+    """
+    import numpy as np
+
+    if k == 2:
+        _k_sum_pairs(values, counts, target, start, used, prefix, results)
+        return
+    if k == 4 and pairs is not None:
+        _k_sum_quads(values, counts, pairs, target, start, used, prefix, results)
+        return
+
+    first = max(start, int(np.searchsorted(values, target - (k - 1) * int(values[-1]))))
+    last = int(np.searchsorted(values, target // k, side="right"))
+
+    for position in range(first, last):
+        already_used = used if position == start else 0
+        if counts[position] <= already_used:
+            continue
+        value = int(values[position])
+        prefix.append(value)
+        _k_sum_search(values, counts, target - value, k - 1, position,
+                      already_used + 1, prefix, results, pairs)
+        prefix.pop()
+
+
+def k_sum(nums: list[int], target: int, k: int, return_indices: bool = False) -> list[tuple]:
+    """
+    Find every unique combination of k numbers that add up to the target.
+
+    The numbers are reduced to sorted distinct values with their counts, so
+    duplicates in nums never produce duplicate answers. The first k - 2
+    values are chosen by a pruned recursive search and the last two by a
+    vectorized complement lookup (the two-pointer step of two_sum_sorted).
+
+    Time complexity: O(n^(k-1) log n) in the worst case, usually far less
+    thanks to the min/max pruning.
+
+    :param nums: List of integers.
+    :param target: Target sum.
+    :param k: Number of elements per combination, k >= 2.
+    :param return_indices: Return one tuple of distinct indices per
+        combination instead of the values.
+    :return: Sorted list of value tuples (non-decreasing), or index tuples.
+    """
+    import numpy as np
+
+    if k < 2:
+        raise ValueError(f"k must be at least 2, got {k}")
+
+    values, counts = np.unique(np.asarray(nums, dtype=np.int64), return_counts=True)
+    results = []
+    pairs = None
+    if k >= 4 and len(values) * (len(values) + 1) // 2 <= K_SUM_PAIR_LIMIT:
+        pairs = _pair_sums(values, counts)
+    if len(values):
+        _k_sum_search(values, counts, target, k, 0, 0, [], results, pairs)
+    results.sort()
+
+    if not return_indices:
+        return results
+
+    positions = {}
+    for i, num in enumerate(nums):
+        positions.setdefault(num, []).append(i)
+
+    index_tuples = []
+    for combination in results:
+        seen = {}
+        indices = []
+        for value in combination:
+            indices.append(positions[value][seen.get(value, 0)])
+            seen[value] = seen.get(value, 0) + 1
+        index_tuples.append(tuple(indices))
+    return index_tuples
+
+
+def three_sum_nested_two_sum(nums: list[int], target: int) -> list[tuple]:
+    """
+    Baseline 3-sum: call two_sum_stream on the rest of the list for every
+    element and deduplicate the value triples.
+    Time complexity: O(n^2) dict operations, plus the pairs reported.
+    """
+    found = set()
+    for i, num in enumerate(nums):
+        rest = nums[i + 1:]
+        for a, b in two_sum_stream(rest, target - num):
+            found.add(tuple(sorted((num, rest[a], rest[b]))))
+    return sorted(found)
+
+
+def benchmark_k_sum(sizes=(1_000, 10_000), baseline_limit: int = 1_000) -> None:
+    """
+    Compare k_sum(k=3) against nesting two_sum for random values.
+    The baseline is skipped above baseline_limit; it already takes about
+    30s at 10_000. For the large run, call
+    benchmark_k_sum(sizes=(1_000, 10_000, 100_000), baseline_limit=10_000).
+
+    :param sizes: List sizes to run.
+    :param baseline_limit: Largest size the baseline is run on.
+    """
+    rng = random.Random(0)
+    k_sum([0, 0, 0], 0, 3)  # import NumPy before timing
+    for size in sizes:
+        nums = [rng.randrange(-10**9, 10**9) for _ in range(size)]
+        target = sum(rng.sample(nums, 3))
+
+        start = time.perf_counter()
+        result = k_sum(nums, target, 3)
+        k_sum_time = time.perf_counter() - start
+
+        line = f"n={size:>7}: k_sum {k_sum_time:.3f}s"
+        if size <= baseline_limit:
+            start = time.perf_counter()
+            expected = three_sum_nested_two_sum(nums, target)
+            nested_time = time.perf_counter() - start
+            assert result == expected
+            line += f", nested two_sum {nested_time:.3f}s ({nested_time / k_sum_time:.0f}x)"
+        print(line)
+
+
 if __name__ == "__main__":
     print(two_sum([2, 7, 11, 15], 9))       # Output: [0, 1]
     print(two_sum([3, 2, 4], 6))            # Output: [1, 2]
@@ -67,3 +654,23 @@ if __name__ == "__main__":
     print(two_sum_opt([7, 11, 15, 2], 9))   # Output: [0, 3]
     print(two_sum_opt([3, 2, 4], 6))        # Output: [1, 2]
     print(twoSum([3, 2, 4], 6))        # Output: [1, 2]
+
+    print(list(two_sum_stream(iter([3, 2, 4, 3, 2]), 6)))
+    # Output: [(1, 2), (0, 3), (2, 4)]
+    print(list(two_sum_stream(iter([3, 2, 4, 3, 2]), 6, window=2)))
+    # Output: [(1, 2), (2, 4)]
+
+    print(two_sum_sorted([7, 11, 15, 2], 9))   # Output: [0, 3]
+    print(two_sum_sorted_all([3, 2, 4, 3, 2], 6).tolist())
+    # Output: [[0, 3], [1, 2], [2, 4]]
+
+    index = TwoSumIndex([3, 2, 4, 3, 15])
+    print(index.query(6))                   # Output: [1, 2]
+    print(index.query(19))                  # Output: [2, 4]
+    print(index.query_many([6, 19, 100]))   # Output: [[1, 2], [2, 4], []]
+
+    print(k_sum([-1, 0, 1, 2, -1, -4], 0, 3))         # Output: [(-1, -1, 2), (-1, 0, 1)]
+    print(k_sum([1, 0, -1, 0, -2, 2], 0, 4))          # Output: [(-2, -1, 1, 2), (-2, 0, 0, 2), (-1, 0, 0, 1)]
+    print(k_sum([-1, 0, 1, 2, -1, -4], 0, 3, return_indices=True))
+    # Output: [(0, 4, 3), (0, 1, 2)]
+    benchmark_k_sum()
@@ -14,9 +14,30 @@ Example:
     >>> is_anagram("hello", "world")
     False
 
+Large inputs:
+    is_anagram_bulk(s, t) compares byte or code-point histograms built with
+    numpy.bincount, works for any Unicode text and for bytes-like payloads.
+
+Searching text:
+    find_anagram_occurrences(pattern, chunks) streams text chunk by chunk and yields
+    every offset where a permutation of pattern starts, in O(1) per character.
+
+Bulk grouping:
+    AnagramIndex / group_anagrams(words) put every word of a stream into a bucket
+    keyed by its letter signature, so a corpus is grouped in one pass instead of
+    comparing every pair of words. Buckets can be spilled to disk.
+
 Usage:
     Run the module directly to see example outputs with predefined test strings.
 """
+import os
+import shutil
+import string
+import tempfile
+import zlib
+from collections import deque
+
+ASCII_LOWERCASE = string.ascii_lowercase
 
 
 def is_anagram(s, t):
@@ -93,6 +114,292 @@ def is_anagram_otp(s, t):
     return True
 
 
+def _code_point_counts(data, size):
+    """
+    Histogram of the bytes (bytes-like input) or code points (str input) of data.
+    Bytes-like input is read through a memoryview without copying.
+    """
+    import numpy as np
+
+    if isinstance(data, str):
+        if data.isascii():
+            units = np.frombuffer(data.encode("ascii"), dtype=np.uint8)
+        else:
+            units = np.frombuffer(data.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    else:
+        units = np.frombuffer(memoryview(data).cast("B"), dtype=np.uint8)
+    return np.bincount(units, minlength=size)
+
+
+def is_anagram_bulk(s, t):
+    """
+    Anagram check for large inputs: str (any Unicode) or bytes-like payloads.
+
+    Cheap checks run first: different lengths, or an ASCII string against a
+    non-ASCII one, are rejected at once. Otherwise both inputs are counted in
+    bulk with numpy.bincount (bytes, ASCII text and other text each in a
+    single C pass) and the histograms are compared. Strings are compared by
+    code point, without Unicode normalization.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n) for str input (one encoded copy), O(1) extra for bytes
+    :type s: str or bytes-like
+    :type t: str or bytes-like
+    :rtype: bool
+    """
+    import numpy as np
+
+    if isinstance(s, str) != isinstance(t, str):
+        raise TypeError("compare str with str or bytes-like with bytes-like")
+
+    if isinstance(s, str):
+        if len(s) != len(t) or s.isascii() != t.isascii():
+            return False
+        size = 128 if s.isascii() else max(map(ord, (max(s), max(t)))) + 1
+    else:
+        if memoryview(s).nbytes != memoryview(t).nbytes:
+            return False
+        size = 256
+
+    return bool(np.array_equal(_code_point_counts(s, size), _code_point_counts(t, size)))
+
+
+def find_anagram_occurrences(pattern, chunks):
+    """
+    Yields every offset in a stream of text where some permutation of pattern starts.
+
+    A sliding window of len(pattern) characters keeps, per character, the
+    difference between its count in the window and in the pattern, plus the
+    number of characters whose difference is not zero. Each incoming and
+    outgoing character changes one difference, so the window matches exactly
+    when that number drops to 0. Only the window is kept, never the text.
+
+    Time Complexity: O(n) for n characters of text
+    Space Complexity: O(m) for a pattern of m characters
+    :type pattern: str
+    :type chunks: Iterable[str] — text chunks (a plain str works too)
+    :rtype: Iterator[int]
+    """
+
+    size = len(pattern)
+    if size == 0:
+        return
+
+    difference = {}
+    for char in pattern:
+        difference[char] = difference.get(char, 0) - 1
+    mismatched = len(difference)
+
+    window = deque()
+    offset = 0
+
+    for chunk in chunks:
+        for char in chunk:
+            after = difference.get(char, 0) + 1
+            if after:
+                difference[char] = after
+            else:
+                del difference[char]
+            mismatched += (after == 1) - (after == 0)
+            window.append(char)
+
+            if len(window) > size:
+                out_char = window.popleft()
+                after = difference.get(out_char, 0) - 1
+                if after:
+                    difference[out_char] = after
+                else:
+                    del difference[out_char]
+                mismatched += (after == -1) - (after == 0)
+
+            offset += 1
+            if mismatched == 0 and len(window) == size:
+                yield offset - size
+
+
+def find_anagram_occurrences_in_file(pattern, path, chunk_size=1 << 20, encoding="utf-8"):
+    """
+    Runs find_anagram_occurrences over a text file read chunk_size characters at a time.
+    Line endings are not translated, so "\r\n" counts as two characters.
+    :type pattern: str
+    :type path: str
+    :rtype: Iterator[int] — character offsets into the file.
+    """
+
+    with open(path, encoding=encoding, newline="") as file:
+        yield from find_anagram_occurrences(pattern, iter(lambda: file.read(chunk_size), ""))
+
+
+def anagram_signature(word):
+    """
+    Key that is equal for two words exactly when they are anagrams.
+
+    Lowercase a-z words shorter than 256 letters get a packed 26-byte letter
+    count, built with 26 C-level str.count scans (linear in the length).
+    Any other word falls back to its sorted characters.
+
+    :type word: str
+    :rtype: bytes or str
+    """
+
+    if len(word) < 256 and word.isascii() and word.isalpha() and word.islower():
+        return bytes(map(word.count, ASCII_LOWERCASE))
+    return "".join(sorted(word))
+
+
+class AnagramIndex:
+    """
+    Groups a stream of words into anagram buckets.
+
+    Buckets live in a dict keyed by anagram_signature. When spill_dir is set
+    and more than max_words_in_memory words are buffered, the words are
+    appended to one of num_shards files chosen by a hash of the signature,
+    so all anagrams of a word land in the same shard; groups() then regroups
+    one shard at a time. Each index keeps its shards in its own temporary
+    directory under spill_dir, so several indexes can share one spill_dir;
+    it is removed when groups() finishes or is closed, or by close(). With
+    spill_dir set, words must not contain "\n" (other line breaks such as
+    "\r" are fine).
+
+    Methods
+    -------
+    add(word): Adds one word.
+    add_many(words): Adds every word of an iterable.
+    groups(): Yields every anagram group as a list of words.
+    close(): Deletes any spilled shards.
+    """
+
+    def __init__(self, spill_dir=None, max_words_in_memory=1_000_000, num_shards=64):
+        """
+        Initializes an empty index; spill_dir=None keeps everything in memory.
+        """
+        self.buckets = {}
+        self.buffered = 0
+        self.spill_dir = spill_dir
+        self.max_words_in_memory = max_words_in_memory
+        self.num_shards = num_shards
+        self.shard_dir = None
+        self.spilled = False
+
+    def _shard_path(self, shard):
+        """
+        Returns the file that stores the given shard.
+        """
+        return os.path.join(self.shard_dir, f"anagram-shard-{shard:04d}.txt")
+
+    def _shard_of(self, signature):
+        """
+        Returns the shard for a signature (stable across processes, unlike hash()).
+        """
+        if isinstance(signature, str):
+            signature = signature.encode("utf-8", "surrogatepass")
+        return zlib.crc32(signature) % self.num_shards
+
+    def spill(self):
+        """
+        Appends every buffered bucket to its shard file and empties memory.
+        """
+        if self.shard_dir is None:
+            self.shard_dir = tempfile.mkdtemp(prefix="anagram-index-", dir=self.spill_dir)
+
+        shard_words = {}
+        for signature, words in self.buckets.items():
+            shard_words.setdefault(self._shard_of(signature), []).extend(words)
+
+        for shard, words in shard_words.items():
+            with open(self._shard_path(shard), "a", encoding="utf-8", errors="surrogatepass",
+                      newline="") as file:
+                file.write("\n".join(words))
+                file.write("\n")
+
+        self.buckets = {}
+        self.buffered = 0
+        self.spilled = True
+
+    def add(self, word):
+        """
+        Adds one word to its bucket, spilling to disk when the buffer is full.
+        Time complexity: O(len(word)) for lowercase a-z words.
+        """
+        if self.spill_dir is not None and "\n" in word:
+            raise ValueError(f"cannot spill a word containing a newline: {word!r}")
+        self.buckets.setdefault(anagram_signature(word), []).append(word)
+        self.buffered += 1
+        if self.spill_dir is not None and self.buffered >= self.max_words_in_memory:
+            self.spill()
+
+    def add_many(self, words):
+        """
+        Adds every word of an iterable (list, generator, file, ...).
+        """
+        add = self.add
+        for word in words:
+            add(word)
+
+    def groups(self):
+        """
+        Yields every anagram group (a list of words in input order).
+        After spilling, groups come out shard by shard and the shard files
+        are removed once read, then the index's temporary directory.
+        """
+        if not self.spilled:
+            yield from self.buckets.values()
+            return
+
+        self.spill()
+        try:
+            for shard in range(self.num_shards):
+                path = self._shard_path(shard)
+                if not os.path.exists(path):
+                    continue
+                buckets = {}
+                # newline="\n" splits lines on "\n" only and leaves "\r" in words.
+                with open(path, encoding="utf-8", errors="surrogatepass", newline="\n") as file:
+                    for line in file:
+                        word = line[:-1]
+                        buckets.setdefault(anagram_signature(word), []).append(word)
+                os.remove(path)
+                yield from buckets.values()
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Deletes the index's temporary directory with any shards not yet read.
+        Words already spilled are lost; buffered words stay in memory.
+        """
+        if self.shard_dir is not None:
+            shutil.rmtree(self.shard_dir, ignore_errors=True)
+            self.shard_dir = None
+        self.spilled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def group_anagrams(words, spill_dir=None, max_words_in_memory=1_000_000):
+    """
+    Groups an iterable of words into anagram groups in one pass.
+    Time complexity: O(total letters) for lowercase a-z words.
+
+    :type words: Iterable[str]
+    :type spill_dir: str — directory for shard files, None to stay in memory.
+    :type max_words_in_memory: int
+    :rtype: Iterator[List[str]]
+    """
+
+    index = AnagramIndex(spill_dir, max_words_in_memory)
+    try:
+        index.add_many(words)
+    except BaseException:
+        index.close()
+        raise
+    return index.groups()
+
+
 if __name__ == "__main__":
     STR_1 = "anagram"
     STR_2 = "nagaram"
@@ -105,3 +412,16 @@ if __name__ == "__main__":
     print(is_anagram(STR_1, STR_2))  # Output: False
     print(is_anagram_sorting(STR_1, STR_2))  # Output: False
     print(is_anagram_otp(STR_1, STR_2))  # Output: False
+
+    print(is_anagram_bulk("Straße", "ßeStra"))  # Output: True
+    print(is_anagram_bulk(b"listen" * 100_000, b"silent" * 100_000))  # Output: True
+    print(is_anagram_bulk("naïve", "naive"))  # Output: False
+
+    print(list(find_anagram_occurrences("abc", ["cbaeb", "abacd"])))  # Output: [0, 6]
+
+    WORDS = ["eat", "tea", "tan", "ate", "nat", "bat"]
+    print(list(group_anagrams(WORDS)))
+    # Output: [['eat', 'tea', 'ate'], ['tan', 'nat'], ['bat']]
+    with tempfile.TemporaryDirectory() as spill_dir:
+        print(sorted(group_anagrams(WORDS, spill_dir, max_words_in_memory=2)))
+        # Output: [['bat'], ['eat', 'tea', 'ate'], ['tan', 'nat']]